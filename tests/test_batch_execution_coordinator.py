@@ -0,0 +1,299 @@
+"""
+Tests for BatchExecutionCoordinator batch semantics.
+
+Uses a real SQLite-backed SQLAlchemyUnitOfWork so commit/rollback
+behaviour is the one production code sees.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from wtb.application.services.batch_execution_coordinator import BatchExecutionCoordinator
+from wtb.domain.interfaces.file_tracking import FileRestoreResult
+from wtb.domain.interfaces.batch_coordinator import (
+    BatchOperationError,
+    BatchOperationRequest,
+    OperationType,
+)
+from wtb.domain.models.workflow import (
+    Execution,
+    ExecutionState,
+    ExecutionStatus,
+    WorkflowNode,
+)
+# Aliased so pytest does not try to collect it as a test class
+from wtb.domain.models.workflow import TestWorkflow as Workflow
+from wtb.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+
+
+class FakeStateAdapter:
+    """State adapter whose checkpoints are named after their state."""
+    
+    MISSING = "missing-checkpoint"
+    SLOW = "slow-checkpoint"
+    
+    def initialize_session(self, execution_id, initial_state):
+        return f"session-{execution_id}"
+    
+    def rollback(self, checkpoint_id):
+        if checkpoint_id == self.MISSING:
+            raise ValueError(f"Checkpoint {checkpoint_id} not found")
+        if checkpoint_id == self.SLOW:
+            time.sleep(0.5)
+        return ExecutionState(current_node_id=checkpoint_id)
+    
+    def load_checkpoint(self, checkpoint_id):
+        return self.rollback(checkpoint_id)
+
+
+class RecordingFileTracking:
+    """File tracking stub that records restored commits in call order."""
+    
+    def __init__(self):
+        self.restored = []
+    
+    def is_available(self):
+        return True
+    
+    def restore_commit(self, commit_id):
+        self.restored.append(commit_id)
+        return FileRestoreResult(commit_id, 0, 0, [], True)
+
+
+@pytest.fixture
+def uow_factory(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'wtb.db'}"
+    return lambda: SQLAlchemyUnitOfWork(db_url)
+
+
+@pytest.fixture
+def executions(uow_factory):
+    """Two completed executions at checkpoint cp-0."""
+    workflow = Workflow(name="wf")
+    workflow.add_node(WorkflowNode(id="start", name="start", type="start"))
+    created = [
+        Execution(
+            workflow_id=workflow.id,
+            status=ExecutionStatus.COMPLETED,
+            state=ExecutionState(current_node_id="cp-0"),
+            checkpoint_id="cp-0",
+        )
+        for _ in range(2)
+    ]
+    with uow_factory() as uow:
+        uow.workflows.add(workflow)
+        for execution in created:
+            uow.executions.add(execution)
+        uow.commit()
+    return [execution.id for execution in created]
+
+
+@pytest.fixture
+def coordinator(uow_factory):
+    return BatchExecutionCoordinator(
+        uow_factory=uow_factory,
+        state_adapter=FakeStateAdapter(),
+    )
+
+
+def _load(uow_factory, execution_id):
+    with uow_factory() as uow:
+        return uow.executions.get(execution_id)
+
+
+def _pending_events(uow_factory):
+    with uow_factory() as uow:
+        return uow.outbox.get_pending()
+
+
+class TestBatchOperateAtomic:
+
+    def test_commits_all_requests(self, coordinator, uow_factory, executions):
+        results = coordinator.batch_operate_atomic([
+            BatchOperationRequest(executions[0], "cp-1", OperationType.ROLLBACK),
+            BatchOperationRequest(executions[1], "cp-2", OperationType.ROLLBACK),
+        ])
+        
+        assert [r.success for r in results] == [True, True]
+        assert _load(uow_factory, executions[0]).checkpoint_id == "cp-1"
+        assert _load(uow_factory, executions[1]).checkpoint_id == "cp-2"
+        assert len(_pending_events(uow_factory)) == 1  # one batch summary
+    
+    def test_failure_leaves_earlier_requests_uncommitted(
+        self, coordinator, uow_factory, executions
+    ):
+        with pytest.raises(BatchOperationError) as exc_info:
+            coordinator.batch_operate_atomic([
+                BatchOperationRequest(executions[0], "cp-1", OperationType.ROLLBACK),
+                BatchOperationRequest(
+                    executions[1], FakeStateAdapter.MISSING, OperationType.ROLLBACK
+                ),
+            ])
+        
+        first, second = exc_info.value.results
+        assert not first.success and first.error.startswith("Rolled back")
+        assert not second.success and "not found" in second.error
+        
+        execution = _load(uow_factory, executions[0])
+        assert execution.checkpoint_id == "cp-0"
+        assert execution.status == ExecutionStatus.COMPLETED
+        assert _pending_events(uow_factory) == []
+
+
+class TestSingleOperation:
+
+    def test_rollback_commits_state_with_audit_event(
+        self, coordinator, uow_factory, executions
+    ):
+        execution = coordinator.rollback(executions[0], "cp-1")
+        
+        assert execution.status == ExecutionStatus.PAUSED
+        assert _load(uow_factory, executions[0]).checkpoint_id == "cp-1"
+        assert len(_pending_events(uow_factory)) == 1
+
+
+class TestBatchOperate:
+
+    def test_run_request_without_graph_fails_only_that_request(
+        self, coordinator, uow_factory, executions
+    ):
+        results = coordinator.batch_operate([
+            BatchOperationRequest(
+                executions[0], "cp-1", OperationType.ROLLBACK_AND_RUN
+            ),
+            BatchOperationRequest(executions[1], "cp-2", OperationType.ROLLBACK),
+        ])
+        
+        assert [r.success for r in results] == [False, True]
+        assert "Graph required for ROLLBACK_AND_RUN" in results[0].error
+        assert _load(uow_factory, executions[0]).checkpoint_id == "cp-0"
+        assert _load(uow_factory, executions[1]).checkpoint_id == "cp-2"
+    
+    def test_parallel_stop_on_error_skips_queued_requests(
+        self, coordinator, uow_factory, executions
+    ):
+        results = coordinator.batch_operate(
+            [
+                BatchOperationRequest(
+                    executions[0], FakeStateAdapter.MISSING, OperationType.ROLLBACK
+                ),
+                BatchOperationRequest(
+                    executions[1], FakeStateAdapter.SLOW, OperationType.ROLLBACK
+                ),
+                BatchOperationRequest(executions[0], "cp-2", OperationType.ROLLBACK),
+                BatchOperationRequest(executions[1], "cp-3", OperationType.ROLLBACK),
+            ],
+            max_workers=2,
+            stop_on_error=True,
+        )
+        
+        # The in-flight request completes; queued ones are left out
+        assert [(r.checkpoint_id, r.success) for r in results] == [
+            (FakeStateAdapter.MISSING, False),
+            (FakeStateAdapter.SLOW, True),
+        ]
+        assert _load(uow_factory, executions[0]).checkpoint_id == "cp-0"
+        assert _load(uow_factory, executions[1]).checkpoint_id == FakeStateAdapter.SLOW
+
+
+class TestBatchOperateCoalesced:
+
+    def test_failed_group_is_rolled_back_as_a_whole(
+        self, coordinator, uow_factory, executions
+    ):
+        results = coordinator.batch_operate(
+            [
+                BatchOperationRequest(executions[0], "cp-1", OperationType.ROLLBACK),
+                BatchOperationRequest(
+                    executions[0], FakeStateAdapter.MISSING, OperationType.ROLLBACK
+                ),
+                BatchOperationRequest(executions[1], "cp-2", OperationType.ROLLBACK),
+            ],
+            coalesce=True,
+        )
+        
+        assert [r.success for r in results] == [False, False, True]
+        assert results[0].error.startswith("Rolled back")
+        assert _load(uow_factory, executions[0]).checkpoint_id == "cp-0"
+        assert _load(uow_factory, executions[1]).checkpoint_id == "cp-2"
+
+
+class GraphRecordingAdapter(FakeStateAdapter):
+    """FakeStateAdapter that records every graph compile."""
+    
+    def __init__(self):
+        self.compiled = []
+    
+    def set_workflow_graph(self, graph, force_recompile=False):
+        self.compiled.append(graph)
+
+
+class TestGraphCache:
+
+    def test_batch_compiles_shared_graph_once(self, uow_factory, executions):
+        adapter = GraphRecordingAdapter()
+        coordinator = BatchExecutionCoordinator(uow_factory, state_adapter=adapter)
+        graph = object()
+        
+        coordinator.batch_operate(
+            [
+                BatchOperationRequest(executions[0], "cp-1", OperationType.ROLLBACK),
+                BatchOperationRequest(executions[1], "cp-2", OperationType.ROLLBACK),
+            ],
+            graph=graph,
+        )
+        
+        assert adapter.compiled == [graph]
+    
+    def test_cache_does_not_outlive_the_batch_call(self, uow_factory, executions):
+        adapter = GraphRecordingAdapter()
+        coordinator = BatchExecutionCoordinator(uow_factory, state_adapter=adapter)
+        graph = object()
+        
+        coordinator.batch_operate_atomic(
+            [BatchOperationRequest(executions[0], "cp-1", OperationType.ROLLBACK)],
+            graph=graph,
+        )
+        coordinator.rollback(executions[1], "cp-2", graph=graph)
+        
+        assert adapter.compiled == [graph, graph]
+
+
+class TestPostCommitRestore:
+
+    def test_restore_after_executor_shutdown_runs_synchronously(self, uow_factory):
+        file_tracking = RecordingFileTracking()
+        coordinator = BatchExecutionCoordinator(
+            uow_factory,
+            state_adapter=FakeStateAdapter(),
+            file_tracking=file_tracking,
+            async_restore=True,
+        )
+        # Executor already shut down but not yet detached, as when
+        # shutdown() races an in-flight operation
+        coordinator._post_commit_executor.shutdown(wait=True)
+        
+        coordinator._restore_files_post_commit(
+            "files-cp-1", "exec-1", "cp-1", "rollback_and_run"
+        )
+        
+        assert file_tracking.restored == ["files-cp-1"]
+
+
+class TestAsyncBatchOperate:
+
+    def test_positional_stop_on_error_matches_interface(
+        self, coordinator, executions
+    ):
+        requests = [
+            BatchOperationRequest(
+                executions[0], FakeStateAdapter.MISSING, OperationType.ROLLBACK
+            ),
+            BatchOperationRequest(executions[1], "cp-2", OperationType.ROLLBACK),
+        ]
+        
+        results = asyncio.run(coordinator.abatch_operate(requests, 1, True))
+        
+        assert len(results) == 1 and not results[0].success
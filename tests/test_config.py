@@ -0,0 +1,14 @@
+"""
+Tests for WTBConfig.
+"""
+
+from wtb.config import WTBConfig
+
+
+class TestEnsureDataDir:
+
+    def test_recreates_a_removed_directory(self, tmp_path):
+        config = WTBConfig(data_dir=str(tmp_path / "data"))
+        config.ensure_data_dir().rmdir()
+        
+        assert config.ensure_data_dir().is_dir()
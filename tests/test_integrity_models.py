@@ -0,0 +1,31 @@
+"""
+Tests for the integrity domain models.
+"""
+
+from wtb.domain.models.integrity import IntegrityIssue, IntegrityReport
+
+
+def _issue():
+    return IntegrityIssue.outbox_stuck(
+        "evt-1", "checkpoint_create", retry_count=5, can_retry=False, message="stuck"
+    )
+
+
+class TestSerialization:
+
+    def test_issue_to_dict_emits_plain_enum_values(self):
+        data = _issue().to_dict()
+        
+        assert type(data["issue_type"]) is str and data["issue_type"] == "outbox_stuck"
+        assert type(data["severity"]) is str and data["severity"] == "critical"
+        assert type(data["suggested_action"]) is str
+        assert IntegrityIssue.from_dict(data) == _issue()
+    
+    def test_columnar_dict_emits_plain_enum_values(self):
+        report = IntegrityReport()
+        report.add_issue(_issue())
+        
+        issues = report.to_columnar_dict()["issues"]
+        
+        assert issues["issue_type"] == ["outbox_stuck"]
+        assert type(issues["severity"][0]) is str
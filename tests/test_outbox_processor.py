@@ -0,0 +1,81 @@
+"""
+Tests for OutboxProcessor event handlers.
+"""
+
+import os
+
+import pytest
+
+from wtb.domain.interfaces.file_tracking import FileCleanupResult
+from wtb.domain.models.outbox import OutboxEvent, OutboxEventType
+from wtb.infrastructure.file_tracking.sqlite_service import SqliteFileTrackingService
+from wtb.infrastructure.outbox.processor import OutboxProcessor
+
+
+class DeletingCleanupService:
+    """Cleanup service whose orphans per checkpoint are given up front."""
+    
+    def __init__(self, orphans):
+        self._orphans = orphans
+    
+    def identify_orphaned_files(self, target_checkpoint_id, **kwargs):
+        return [path for path in self._orphans.get(target_checkpoint_id, [])
+                if os.path.exists(path)]
+    
+    def cleanup_orphaned_files(self, checkpoint_id, execution_id, orphaned_paths, **kwargs):
+        for path in orphaned_paths:
+            os.remove(path)
+        return FileCleanupResult(
+            checkpoint_id=checkpoint_id,
+            execution_id=execution_id,
+            files_deleted=len(orphaned_paths),
+            deleted_paths=tuple(str(path) for path in orphaned_paths),
+        )
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    path = tmp_path / "workspace"
+    path.mkdir()
+    return path
+
+
+class TestRollbackFileRestoreBatch:
+
+    def test_cleanup_runs_before_the_next_restore(self, tmp_path, workspace):
+        file_tracking = SqliteFileTrackingService(tmp_path / "filetrack")
+        (workspace / "a.txt").write_text("a")
+        commit_a = file_tracking.track_files([str(workspace / "a.txt")]).commit_id
+        (workspace / "b.txt").write_text("b")
+        commit_b = file_tracking.track_files([str(workspace / "b.txt")]).commit_id
+        
+        # b.txt is orphaned relative to checkpoint 1, but checkpoint 2 owns it
+        processor = OutboxProcessor(
+            wtb_db_url=f"sqlite:///{tmp_path / 'wtb.db'}",
+            file_tracking_service=file_tracking,
+            file_cleanup_service=DeletingCleanupService(
+                {1: [str(workspace / "b.txt")]}
+            ),
+        )
+        (workspace / "b.txt").unlink()
+        
+        processor._handle_rollback_file_restore_batch(OutboxEvent(
+            event_type=OutboxEventType.ROLLBACK_FILE_RESTORE_BATCH,
+            aggregate_type="Batch",
+            aggregate_id="batch-1",
+            payload={
+                "cleanup_orphaned_files": True,
+                "cleanup_backup": False,
+                "workspace_path": str(workspace),
+                "restores": [
+                    {"execution_id": "exec-a", "source_commit_id": commit_a,
+                     "target_checkpoint_id": 1},
+                    {"execution_id": "exec-b", "source_commit_id": commit_b,
+                     "target_checkpoint_id": 2},
+                ],
+            },
+        ))
+        
+        # Same end state as restore A -> cleanup A -> restore B -> cleanup B
+        assert (workspace / "a.txt").read_text() == "a"
+        assert (workspace / "b.txt").read_text() == "b"
@@ -0,0 +1,64 @@
+"""
+Tests for SqliteFileTrackingService.
+"""
+
+import hashlib
+import os
+import time
+
+import pytest
+
+from wtb.infrastructure.file_tracking.sqlite_service import (
+    DIGEST_RACY_WINDOW_NS,
+    SqliteFileTrackingService,
+)
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture
+def service(tmp_path):
+    return SqliteFileTrackingService(tmp_path / "workspace")
+
+
+class TestDigestCache:
+
+    def test_racily_clean_file_is_rehashed(self, service, tmp_path):
+        path = tmp_path / "out.txt"
+        path.write_bytes(b"aaaa")
+        stat = path.stat()
+        assert service._digest_file(str(path)) == (_sha256(b"aaaa"), 4)
+        
+        # Same size, same mtime: only the content tells the writes apart
+        path.write_bytes(b"bbbb")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        
+        assert service._digest_file(str(path)) == (_sha256(b"bbbb"), 4)
+    
+    def test_settled_file_is_memoized(self, service, tmp_path):
+        path = tmp_path / "out.txt"
+        path.write_bytes(b"aaaa")
+        settled_ns = time.time_ns() - 2 * DIGEST_RACY_WINDOW_NS
+        os.utime(path, ns=(settled_ns, settled_ns))
+        
+        service._digest_file(str(path))
+        
+        assert len(service._digest_cache) == 1
+
+
+class TestRestoreCommits:
+
+    def test_restores_in_order_so_the_last_commit_wins(self, service, tmp_path):
+        path = tmp_path / "out.txt"
+        path.write_text("first")
+        first = service.track_files([str(path)]).commit_id
+        path.write_text("second version")
+        second = service.track_files([str(path)]).commit_id
+        
+        results = service.restore_commits([second, first])
+        
+        assert [r.commit_id for r in results] == [second, first]
+        assert all(r.success for r in results)
+        assert path.read_text() == "first"
@@ -0,0 +1,46 @@
+"""
+Tests for API input validators.
+"""
+
+import pytest
+
+from wtb.application.validators import (
+    validate_batch_test_id,
+    validate_checkpoint_id,
+    validate_execution_id,
+    validate_node_id,
+    validate_reason,
+    validate_workflow_id,
+)
+
+
+class TestIdValidators:
+
+    def test_accept_their_parameter_names_as_keywords(self):
+        assert validate_execution_id(execution_id=" exec-1 ") == "exec-1"
+        assert validate_checkpoint_id(checkpoint_id="cp-1") == "cp-1"
+        assert validate_workflow_id(workflow_id="wf-1") == "wf-1"
+        assert validate_batch_test_id(batch_test_id="bt-1", strict=False) == "bt-1"
+    
+    @pytest.mark.parametrize("value, message", [
+        ("", "execution_id is required"),
+        (5, "execution_id must be a string"),
+        ("   ", "execution_id cannot be empty"),
+    ])
+    def test_invalid_ids_keep_validate_uuid_messages(self, value, message):
+        with pytest.raises(ValueError, match=message):
+            validate_execution_id(value)
+
+
+class TestStringValidators:
+
+    def test_accept_their_parameter_names_as_keywords(self):
+        assert validate_node_id(node_id=" node ") == "node"
+        assert validate_reason(reason="", required=False) is None
+    
+    def test_node_id_bounds(self):
+        assert validate_node_id("x" * 256) == "x" * 256
+        with pytest.raises(ValueError, match="exceeds maximum length of 256"):
+            validate_node_id("x" * 257)
+        with pytest.raises(ValueError, match="at least 1 characters"):
+            validate_node_id("  ", required=False)
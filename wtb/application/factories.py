@@ -16,6 +16,8 @@ ACID Compliance (v1.7):
 - UoW lifecycle properly managed (enter/exit)
 """
 
+from __future__ import annotations
+
 from typing import Optional, Callable, TYPE_CHECKING, Tuple
 from dataclasses import dataclass
 from contextlib import contextmanager
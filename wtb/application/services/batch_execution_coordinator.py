@@ -49,36 +49,96 @@ Usage:
     ])
 """
 
+import asyncio
 import logging
-from typing import List, Optional, Dict, Any, Callable, TYPE_CHECKING
+import threading
+import uuid
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import List, Optional, Dict, Any, Callable, Iterator, Tuple, TYPE_CHECKING
 
 from wtb.domain.interfaces.batch_coordinator import (
     IBatchExecutionCoordinator,
+    IAsyncBatchExecutionCoordinator,
     IExecutionControllerFactory,
     OperationType,
     BatchOperationRequest,
     BatchOperationResult,
+    BatchOperationError,
 )
 from wtb.domain.models.outbox import OutboxEvent, OutboxEventType
+from wtb.domain.interfaces.node_executor import INodeExecutor
+from wtb.domain.interfaces.unit_of_work import IUnitOfWork
+from wtb.application.services.execution_controller import (
+    ExecutionController,
+    DefaultNodeExecutor,
+)
 
 if TYPE_CHECKING:
-    from wtb.domain.interfaces.unit_of_work import IUnitOfWork
     from wtb.domain.interfaces.state_adapter import IStateAdapter
     from wtb.domain.interfaces.file_tracking import IFileTrackingService
+    from wtb.domain.interfaces.execution_controller import IExecutionController
     from wtb.domain.models.workflow import Execution
     from wtb.config import WTBConfig
 
 logger = logging.getLogger(__name__)
 
 
+class _DeferredCommitUnitOfWork(IUnitOfWork):
+    """
+    UoW view that leaves the commit to the coordinator.
+    
+    ExecutionController commits after every state change. Controllers
+    built by the coordinator get this view instead of the real UoW, so an
+    operation (or a whole atomic batch) and its outbox events are
+    committed together by the coordinator, or rolled back together.
+    
+    Repository attributes are read from the wrapped UoW.
+    """
+    
+    def __init__(self, uow: IUnitOfWork):
+        self._uow = uow
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._uow, name)
+    
+    def __enter__(self) -> "_DeferredCommitUnitOfWork":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # The wrapped UoW's own context manager owns the transaction
+        pass
+    
+    def commit(self):
+        """No-op: the coordinator commits the wrapped UoW."""
+        pass
+    
+    def rollback(self):
+        """Roll back the wrapped UoW."""
+        self._uow.rollback()
+
+
 class DefaultExecutionControllerFactory(IExecutionControllerFactory):
     """
     Default factory for creating ExecutionController instances.
     
     Creates ExecutionController with provided dependencies.
     Each call creates a fresh controller for ACID isolation.
+    
+    The node executor is stateless, so one instance is shared by every
+    controller this factory creates.
     """
     
+    def __init__(self, node_executor: Optional[INodeExecutor] = None):
+        """
+        Initialize factory.
+        
+        Args:
+            node_executor: Node executor shared by created controllers.
+                           Defaults to DefaultNodeExecutor.
+        """
+        self._node_executor = node_executor or DefaultNodeExecutor()
+    
     def create(
         self,
         uow: "IUnitOfWork",
@@ -86,22 +146,17 @@ class DefaultExecutionControllerFactory(IExecutionControllerFactory):
         file_tracking_service: Optional["IFileTrackingService"] = None,
     ) -> "IExecutionController":
         """Create ExecutionController with injected dependencies."""
-        from wtb.application.services.execution_controller import (
-            ExecutionController,
-            DefaultNodeExecutor,
-        )
-        
         return ExecutionController(
             execution_repository=uow.executions,
             workflow_repository=uow.workflows,
             state_adapter=state_adapter,
-            node_executor=DefaultNodeExecutor(),
+            node_executor=self._node_executor,
             unit_of_work=uow,
             file_tracking_service=file_tracking_service,
         )
 
 
-class BatchExecutionCoordinator(IBatchExecutionCoordinator):
+class BatchExecutionCoordinator(IBatchExecutionCoordinator, IAsyncBatchExecutionCoordinator):
     """
     Coordinates batch rollback/fork operations.
     
@@ -112,7 +167,7 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
     SOLID Compliance:
     - SRP: Only coordinates operations, delegates to ExecutionController
     - OCP: New operations via OperationType enum
-    - LSP: Implements IBatchExecutionCoordinator fully
+    - LSP: Implements IBatchExecutionCoordinator and IAsyncBatchExecutionCoordinator fully
     - ISP: Interface methods are focused and necessary
     - DIP: Depends on abstractions (IUnitOfWork, IStateAdapter, etc.)
     
@@ -137,6 +192,28 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
         forked = coordinator.fork(exec_id, checkpoint_id, {"temperature": 0.7})
     """
     
+    # OperationType -> (handler method name, result carries new_execution_id)
+    _HANDLERS: Dict[OperationType, tuple] = {
+        OperationType.ROLLBACK: ("_do_rollback", False),
+        OperationType.FORK: ("_do_fork", True),
+        OperationType.ROLLBACK_AND_RUN: ("_do_rollback_and_run", False),
+        OperationType.FORK_AND_RUN: ("_do_fork_and_run", True),
+    }
+    
+    # OperationType -> in-UoW handler used by batch_operate_atomic()
+    _APPLY_HANDLERS: Dict[OperationType, str] = {
+        OperationType.ROLLBACK: "_apply_rollback",
+        OperationType.FORK: "_apply_fork",
+        OperationType.ROLLBACK_AND_RUN: "_apply_rollback_and_run",
+        OperationType.FORK_AND_RUN: "_apply_fork_and_run",
+    }
+    
+    # Per-request audit event type -> batch summary event type
+    _BATCH_AUDIT_TYPES: Dict[OutboxEventType, OutboxEventType] = {
+        OutboxEventType.ROLLBACK_PERFORMED: OutboxEventType.BATCH_ROLLBACK_PERFORMED,
+        OutboxEventType.EXECUTION_FORKED: OutboxEventType.BATCH_FORK_PERFORMED,
+    }
+    
     def __init__(
         self,
         uow_factory: Callable[[], "IUnitOfWork"],
@@ -144,6 +221,7 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
         state_adapter: Optional["IStateAdapter"] = None,
         file_tracking: Optional["IFileTrackingService"] = None,
         config: Optional["WTBConfig"] = None,
+        async_restore: bool = False,
     ):
         """
         Initialize coordinator with dependencies.
@@ -157,6 +235,10 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
                           Must be thread-safe if used concurrently.
             file_tracking: Optional FileTrackingService for file restore operations.
             config: Optional WTBConfig for rollback cleanup options (v1.9).
+            async_restore: If True, post-commit file restores run on a
+                           background thread instead of blocking the caller.
+                           Call shutdown() to wait for pending restores;
+                           restores after shutdown() run synchronously.
         
         Design Decision:
             StateAdapter is REUSED across operations because:
@@ -175,6 +257,32 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
         self._state_adapter = state_adapter
         self._file_tracking = file_tracking
         self._config = config
+        # Serializes set_workflow_graph() mutation on the shared adapter
+        # when batch_operate() runs requests on worker threads.
+        self._graph_lock = threading.RLock()
+        # Resolved once: LangGraph adapters expose set_workflow_graph(), others don't
+        self._set_graph: Optional[Callable[..., Any]] = getattr(
+            state_adapter, 'set_workflow_graph', None
+        )
+        # Graph currently compiled on the adapter while a batch call is in
+        # progress; avoids recompiling the same graph for every operation of
+        # that batch. Cleared when the last open batch call returns.
+        self._current_graph: Optional[Any] = None
+        self._graph_scopes = 0
+        # Built on first use; identical for every rollback payload
+        self._cleanup_options: Optional[Dict[str, Any]] = None
+        # Best-effort file restores run here when async_restore is set
+        self._post_commit_executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=2, thread_name_prefix="wtb-postcommit")
+            if async_restore else None
+        )
+        self._handlers: Dict[OperationType, tuple] = {
+            op: (getattr(self, name), is_fork)
+            for op, (name, is_fork) in self._HANDLERS.items()
+        }
+        self._apply_handlers: Dict[OperationType, Callable[..., tuple]] = {
+            op: getattr(self, name) for op, name in self._APPLY_HANDLERS.items()
+        }
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Single Operations
@@ -211,102 +319,23 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
             ValueError: If execution or checkpoint not found
             RuntimeError: If rollback fails
         """
-        file_commit_id: Optional[str] = None
-        execution: Optional["Execution"] = None
-        
         # v1.8: Set graph on state adapter if provided (for LangGraph rollback)
-        if graph and hasattr(self._state_adapter, 'set_workflow_graph'):
-            self._state_adapter.set_workflow_graph(graph, force_recompile=True)
-            logger.debug(f"Set graph on state adapter for rollback")
+        self._ensure_graph(graph)
         
         # Single Phase: UoW Transaction (State + File Restore Outbox = ACID)
         # Both rollback state AND file restore intent are in same transaction
-        uow = self._uow_factory()
-        try:
-            uow.__enter__()
-            
-            controller = self._controller_factory.create(
-                uow=uow,
-                state_adapter=self._state_adapter,
-                file_tracking_service=self._file_tracking,
-            )
-            
+        def op(controller: "IExecutionController"):
             execution = controller.rollback(execution_id, checkpoint_id)
-            
             # Extract file_commit_id from execution state if available
             file_commit_id = self._extract_file_commit_id(execution)
-            
-            # 1. Emit audit event via outbox (for tracking)
-            audit_event = OutboxEvent.create(
-                event_type=OutboxEventType.ROLLBACK_PERFORMED,
-                aggregate_id=execution_id,
-                aggregate_type="Execution",
-                payload={
-                    "execution_id": execution_id,
-                    "checkpoint_id": checkpoint_id,
-                    "file_commit_id": file_commit_id,
-                    "operation": "rollback",
-                },
+            # 1. Audit event + 2. file restore event (ACID file restoration)
+            return execution, self._build_rollback_events(
+                execution_id, checkpoint_id, file_commit_id
             )
-            uow.outbox.add(audit_event)
-            
-            # 2. Emit file restore event via outbox (for ACID file restoration)
-            # This ensures file restoration is coordinated via outbox processor
-            if file_commit_id and self._file_tracking:
-                # Build payload with base restore info
-                file_restore_payload = {
-                    "source_checkpoint_id": checkpoint_id,
-                    "target_checkpoint_id": checkpoint_id,
-                    "source_commit_id": file_commit_id,
-                    "execution_id": execution_id,
-                }
-                
-                # v1.9: Add cleanup configuration if enabled
-                if self._config and self._config.rollback_cleanup_enabled:
-                    file_restore_payload.update({
-                        "cleanup_orphaned_files": True,
-                        "cleanup_dry_run": self._config.rollback_cleanup_dry_run,
-                        "cleanup_backup": self._config.rollback_cleanup_backup,
-                        "cleanup_max_files": self._config.rollback_cleanup_max_files,
-                    })
-                    
-                    # Add workspace path and patterns from file_tracking_config
-                    if self._config.file_tracking_config:
-                        ft_cfg = self._config.file_tracking_config
-                        file_restore_payload.update({
-                            "workspace_path": str(ft_cfg.workspace_path) if ft_cfg.workspace_path else ".",
-                            "track_patterns": ft_cfg.auto_track_patterns or [],
-                            "exclude_patterns": ft_cfg.exclude_patterns or [],
-                        })
-                    
-                    logger.debug(
-                        f"Rollback cleanup enabled: dry_run={self._config.rollback_cleanup_dry_run}, "
-                        f"backup={self._config.rollback_cleanup_backup}, "
-                        f"max_files={self._config.rollback_cleanup_max_files}"
-                    )
-                
-                file_restore_event = OutboxEvent.create(
-                    event_type=OutboxEventType.ROLLBACK_FILE_RESTORE,
-                    aggregate_id=execution_id,
-                    aggregate_type="Execution",
-                    payload=file_restore_payload,
-                )
-                uow.outbox.add(file_restore_event)
-                logger.debug(f"Queued file restore for commit {file_commit_id}")
-            
-            uow.commit()
-            
-        except Exception as e:
-            uow.rollback()
-            logger.error(f"Rollback failed for {execution_id}: {e}")
-            raise
-        finally:
-            uow.__exit__(None, None, None)
         
-        # No more post-commit file restore - all handled via outbox pattern
+        # No post-commit file restore - all handled via outbox pattern
         # OutboxProcessor will process ROLLBACK_FILE_RESTORE event
-        
-        return execution
+        return self._run_in_uow(op, "Rollback", execution_id)
     
     def fork(
         self,
@@ -339,49 +368,20 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
             RuntimeError: If fork fails
         """
         # v1.8: Set graph on state adapter if provided (for LangGraph fork)
-        if graph and hasattr(self._state_adapter, 'set_workflow_graph'):
-            self._state_adapter.set_workflow_graph(graph, force_recompile=True)
-            logger.debug(f"Set graph on state adapter for fork")
+        self._ensure_graph(graph)
         
-        forked: Optional["Execution"] = None
-        
-        uow = self._uow_factory()
-        try:
-            uow.__enter__()
-            
-            controller = self._controller_factory.create(
-                uow=uow,
-                state_adapter=self._state_adapter,
-                file_tracking_service=self._file_tracking,
-            )
-            
+        def op(controller: "IExecutionController"):
             forked = controller.fork(execution_id, checkpoint_id, new_state)
-            
             # Emit audit event
-            outbox_event = OutboxEvent.create(
-                event_type=OutboxEventType.EXECUTION_FORKED,
-                aggregate_id=forked.id,
-                aggregate_type="Execution",
-                payload={
-                    "source_execution_id": execution_id,
-                    "fork_execution_id": forked.id,
-                    "source_checkpoint_id": checkpoint_id,
-                    "new_state_keys": list(new_state.keys()) if new_state else [],
-                },
-            )
-            uow.outbox.add(outbox_event)
-            uow.commit()
-            
-        except Exception as e:
-            uow.rollback()
-            logger.error(f"Fork failed for {execution_id}: {e}")
-            raise
-        finally:
-            uow.__exit__(None, None, None)
+            return forked, [self._build_fork_event(
+                execution_id, checkpoint_id, forked, new_state
+            )]
+        
+        forked = self._run_in_uow(op, "Fork", execution_id)
         
         logger.info(
-            f"Forked execution {forked.id} from {execution_id} "
-            f"at checkpoint {checkpoint_id[:8]}..."
+            "Forked execution %s from %s at checkpoint %.8s...",
+            forked.id, execution_id, checkpoint_id,
         )
         
         return forked
@@ -412,19 +412,10 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
         if graph is None:
             raise ValueError("Graph is required for rollback_and_run operation")
         
-        file_commit_id: Optional[str] = None
-        execution: Optional["Execution"] = None
+        # controller.run() compiles this graph on the shared adapter
+        self._invalidate_graph()
         
-        uow = self._uow_factory()
-        try:
-            uow.__enter__()
-            
-            controller = self._controller_factory.create(
-                uow=uow,
-                state_adapter=self._state_adapter,
-                file_tracking_service=self._file_tracking,
-            )
-            
+        def op(controller: "IExecutionController"):
             # Rollback state
             execution = controller.rollback(execution_id, checkpoint_id)
             file_commit_id = self._extract_file_commit_id(execution)
@@ -433,27 +424,11 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
             execution = controller.run(execution_id, graph=graph)
             
             # Single audit event for compound operation
-            outbox_event = OutboxEvent.create(
-                event_type=OutboxEventType.ROLLBACK_PERFORMED,
-                aggregate_id=execution_id,
-                aggregate_type="Execution",
-                payload={
-                    "execution_id": execution_id,
-                    "checkpoint_id": checkpoint_id,
-                    "continued": True,
-                    "final_status": execution.status.value,
-                    "file_commit_id": file_commit_id,
-                },
-            )
-            uow.outbox.add(outbox_event)
-            uow.commit()
-            
-        except Exception as e:
-            uow.rollback()
-            logger.error(f"Rollback and run failed for {execution_id}: {e}")
-            raise
-        finally:
-            uow.__exit__(None, None, None)
+            return (execution, file_commit_id), [self._build_rollback_and_run_event(
+                execution_id, checkpoint_id, execution, file_commit_id
+            )]
+        
+        execution, file_commit_id = self._run_in_uow(op, "Rollback and run", execution_id)
         
         # Post-commit file restore
         self._restore_files_post_commit(
@@ -493,19 +468,10 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
         if graph is None:
             raise ValueError("Graph is required for fork_and_run operation")
         
-        forked: Optional["Execution"] = None
-        result: Optional["Execution"] = None
+        # controller.run() compiles this graph on the shared adapter
+        self._invalidate_graph()
         
-        uow = self._uow_factory()
-        try:
-            uow.__enter__()
-            
-            controller = self._controller_factory.create(
-                uow=uow,
-                state_adapter=self._state_adapter,
-                file_tracking_service=self._file_tracking,
-            )
-            
+        def op(controller: "IExecutionController"):
             # Fork from checkpoint
             forked = controller.fork(execution_id, checkpoint_id, new_state)
             
@@ -513,31 +479,15 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
             result = controller.run(forked.id, graph=graph)
             
             # Audit event
-            outbox_event = OutboxEvent.create(
-                event_type=OutboxEventType.EXECUTION_FORKED,
-                aggregate_id=forked.id,
-                aggregate_type="Execution",
-                payload={
-                    "source_execution_id": execution_id,
-                    "fork_execution_id": forked.id,
-                    "source_checkpoint_id": checkpoint_id,
-                    "ran_immediately": True,
-                    "final_status": result.status.value,
-                },
-            )
-            uow.outbox.add(outbox_event)
-            uow.commit()
-            
-        except Exception as e:
-            uow.rollback()
-            logger.error(f"Fork and run failed for {execution_id}: {e}")
-            raise
-        finally:
-            uow.__exit__(None, None, None)
+            return (forked, result), [self._build_fork_and_run_event(
+                execution_id, checkpoint_id, forked, result
+            )]
+        
+        forked, result = self._run_in_uow(op, "Fork and run", execution_id)
         
         logger.info(
-            f"Forked and ran execution {forked.id} from {execution_id}, "
-            f"final status: {result.status.value}"
+            "Forked and ran execution %s from %s, final status: %s",
+            forked.id, execution_id, result.status.value,
         )
         
         return result
@@ -551,6 +501,8 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
         requests: List[BatchOperationRequest],
         stop_on_error: bool = False,
         graph: Optional[Any] = None,
+        max_workers: int = 1,
+        coalesce: bool = False,
     ) -> List[BatchOperationResult]:
         """
         Execute batch operations.
@@ -558,87 +510,443 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
         Each request is processed in its own transaction for ACID isolation.
         StateAdapter is reused across all operations for efficiency.
         
+        With coalesce=True, adjacent requests for the same execution_id
+        share one UoW (one BEGIN/COMMIT and one outbox write per group, see
+        batch_operate_atomic). Isolation is then at group granularity: a
+        failure rolls back the whole group and every member is reported
+        as failed.
+        
         Args:
             requests: List of operation requests
             stop_on_error: If True, stop on first error
             graph: Optional LangGraph graph for state adapter (v1.8)
                    Required if using LangGraphStateAdapter.
+            max_workers: Number of worker threads. Requests are dispatched
+                         concurrently when > 1; the StateAdapter must then
+                         be thread-safe. With stop_on_error, requests not yet
+                         started when a failure is seen are skipped, but
+                         requests already in flight still complete.
+            coalesce: If True, group adjacent same-execution requests into
+                      one transaction. Applies to sequential dispatch only.
             
         Returns:
             List of results (same order as requests)
         """
+        with self._graph_scope():
+            # Nothing to batch: skip the loop and result pre-allocation
+            if len(requests) == 1:
+                return [self._dispatch_single(requests[0], graph)]
+            
+            if max_workers > 1 and len(requests) > 1:
+                return self._batch_operate_parallel(
+                    requests, graph, max_workers, stop_on_error
+                )
+            
+            if coalesce:
+                return self._batch_operate_coalesced(requests, graph, stop_on_error)
+            
+            return self._batch_operate_sequential(requests, graph, stop_on_error)
+    
+    def _batch_operate_sequential(
+        self,
+        requests: List[BatchOperationRequest],
+        graph: Optional[Any],
+        stop_on_error: bool = False,
+    ) -> List[BatchOperationResult]:
+        """Dispatch requests one by one, each in its own UoW."""
+        results: List[Optional[BatchOperationResult]] = [None] * len(requests)
+        
+        for index, req in enumerate(requests):
+            result = results[index] = self._dispatch_single(req, graph)
+            if stop_on_error and not result.success:
+                return results[:index + 1]
+        
+        return results
+    
+    def _batch_operate_coalesced(
+        self,
+        requests: List[BatchOperationRequest],
+        graph: Optional[Any],
+        stop_on_error: bool = False,
+    ) -> List[BatchOperationResult]:
+        """
+        Dispatch requests group by group, one UoW per coalesced group.
+        
+        Single-request groups keep the per-request path; larger groups go
+        through batch_operate_atomic() so their state changes, outbox
+        events and commit are shared.
+        """
         results: List[BatchOperationResult] = []
         
-        for req in requests:
-            try:
-                if req.operation == OperationType.ROLLBACK:
-                    execution = self.rollback(
-                        req.execution_id, req.checkpoint_id, graph=graph
+        for group in self._coalesce(requests):
+            if len(group) == 1:
+                group_results = [self._dispatch_single(group[0], graph)]
+            else:
+                try:
+                    group_results = self.batch_operate_atomic(
+                        group, graph=graph, detailed_audit=True
                     )
-                    results.append(BatchOperationResult(
-                        execution_id=req.execution_id,
-                        checkpoint_id=req.checkpoint_id,
-                        operation=req.operation,
-                        success=True,
-                        result_execution=execution,
-                    ))
+                except BatchOperationError as e:
+                    group_results = e.results
+            
+            results.extend(group_results)
+            if stop_on_error and not all(r.success for r in group_results):
+                break
+        
+        return results
+    
+    @staticmethod
+    def _coalesce(
+        requests: List[BatchOperationRequest],
+    ) -> List[List[BatchOperationRequest]]:
+        """
+        Group adjacent requests that target the same execution_id.
+        
+        Only neighbours are merged, so request order (and therefore the
+        order of state changes per execution) is preserved.
+        """
+        groups: List[List[BatchOperationRequest]] = []
+        for req in requests:
+            if groups and groups[-1][0].execution_id == req.execution_id:
+                groups[-1].append(req)
+            else:
+                groups.append([req])
+        return groups
+    
+    def _batch_operate_parallel(
+        self,
+        requests: List[BatchOperationRequest],
+        graph: Optional[Any],
+        max_workers: int,
+        stop_on_error: bool = False,
+    ) -> List[BatchOperationResult]:
+        """
+        Dispatch requests on a thread pool, preserving request order.
+        
+        Each worker opens its own UoW via uow_factory(), so connections
+        never cross threads. With stop_on_error, the first failure sets a
+        stop event: queued requests are cancelled or skip before opening a
+        UoW, and are left out of the results.
+        """
+        results: List[Optional[BatchOperationResult]] = [None] * len(requests)
+        stop = threading.Event()
+        
+        def run(req: BatchOperationRequest) -> Optional[BatchOperationResult]:
+            if stop.is_set():
+                return None
+            result = self._dispatch_single(req, graph)
+            if stop_on_error and not result.success:
+                stop.set()
+            return result
+        
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(requests)),
+            thread_name_prefix="wtb-batch",
+        ) as executor:
+            futures = {
+                executor.submit(run, req): index
+                for index, req in enumerate(requests)
+            }
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                results[futures[future]] = future.result()
+                if stop.is_set():
+                    for pending in futures:
+                        pending.cancel()
+        
+        if stop_on_error:
+            return [result for result in results if result is not None]
+        return results
+    
+    def _dispatch_single(
+        self,
+        req: BatchOperationRequest,
+        graph: Optional[Any] = None,
+    ) -> BatchOperationResult:
+        """
+        Process one batch request, converting failures into a result.
+        
+        Never raises - errors are reported via BatchOperationResult.error.
+        """
+        try:
+            entry = self._handlers.get(req.operation)
+            if entry is None:
+                raise ValueError(f"Unsupported operation: {req.operation}")
+            handler, is_fork = entry
+            execution = handler(req, graph)
+            return BatchOperationResult(
+                execution_id=req.execution_id,
+                checkpoint_id=req.checkpoint_id,
+                operation=req.operation,
+                success=True,
+                result_execution=execution,
+                new_execution_id=execution.id if is_fork else None,
+            )
+        except Exception as e:
+            logger.error(f"Batch operation failed for {req.execution_id}: {e}")
+            return BatchOperationResult(
+                execution_id=req.execution_id,
+                checkpoint_id=req.checkpoint_id,
+                operation=req.operation,
+                success=False,
+                error=str(e),
+            )
+    
+    def _do_rollback(self, req: BatchOperationRequest, graph: Optional[Any]) -> "Execution":
+        return self.rollback(req.execution_id, req.checkpoint_id, graph=graph)
+    
+    def _do_fork(self, req: BatchOperationRequest, graph: Optional[Any]) -> "Execution":
+        return self.fork(req.execution_id, req.checkpoint_id, req.new_state, graph=graph)
+    
+    def _do_rollback_and_run(self, req: BatchOperationRequest, graph: Optional[Any]) -> "Execution":
+        if not req.graph:
+            raise ValueError("Graph required for ROLLBACK_AND_RUN")
+        return self.rollback_and_run(req.execution_id, req.checkpoint_id, req.graph)
+    
+    def _do_fork_and_run(self, req: BatchOperationRequest, graph: Optional[Any]) -> "Execution":
+        if not req.graph:
+            raise ValueError("Graph required for FORK_AND_RUN")
+        return self.fork_and_run(
+            req.execution_id, req.checkpoint_id, req.graph, req.new_state
+        )
+    
+    def batch_operate_atomic(
+        self,
+        requests: List[BatchOperationRequest],
+        graph: Optional[Any] = None,
+        detailed_audit: bool = False,
+    ) -> List[BatchOperationResult]:
+        """
+        Execute batch operations in a single UoW transaction.
+        
+        Trades per-request isolation for all-or-nothing atomicity: one UoW,
+        one controller and one commit for the whole batch instead of N.
+        If any request fails, the whole transaction is rolled back and
+        BatchOperationError is raised with a per-request status list.
+        
+        Transaction Flow:
+        1. [UoW] controller.rollback()/fork() (+ run()) per request
+        2. [UoW] outbox.add_many(...) once: one BATCH_ROLLBACK_PERFORMED
+           and/or BATCH_FORK_PERFORMED summary event, plus one
+           ROLLBACK_FILE_RESTORE_BATCH event covering every rollback
+        3. [UoW] commit() once
+        4. [Post] file_tracking.restore_commit() for *_AND_RUN rollbacks
+        
+        Args:
+            requests: List of operation requests
+            graph: Optional LangGraph graph for state adapter (v1.8)
+            detailed_audit: If True, emit the per-request ROLLBACK_PERFORMED /
+                            EXECUTION_FORKED events instead of batch summaries
+            
+        Returns:
+            List of results (same order as requests)
+            
+        Raises:
+            BatchOperationError: If any request fails (nothing is committed)
+        """
+        with self._graph_scope():
+            return self._batch_operate_atomic(requests, graph, detailed_audit)
+    
+    def _batch_operate_atomic(
+        self,
+        requests: List[BatchOperationRequest],
+        graph: Optional[Any],
+        detailed_audit: bool,
+    ) -> List[BatchOperationResult]:
+        """batch_operate_atomic() body, run inside a graph scope."""
+        self._ensure_graph(graph)
+        
+        batch_id = str(uuid.uuid4())
+        results: List[BatchOperationResult] = []
+        pending_events: List[OutboxEvent] = []
+        # Per-request audit payloads, keyed by their per-request event type
+        audit_ops: Dict[OutboxEventType, List[Dict[str, Any]]] = {
+            event_type: [] for event_type in self._BATCH_AUDIT_TYPES
+        }
+        restores: List[Dict[str, Any]] = []
+        post_commit_restores: List[tuple] = []
+        
+        try:
+            with self._uow_factory() as uow:
+                controller = self._create_controller(uow)
+                
+                for req in requests:
+                    try:
+                        execution, events = self._apply_in_uow(controller, req, restores)
+                    except Exception as e:
+                        results.append(BatchOperationResult(
+                            execution_id=req.execution_id,
+                            checkpoint_id=req.checkpoint_id,
+                            operation=req.operation,
+                            success=False,
+                            error=str(e),
+                        ))
+                        raise
                     
-                elif req.operation == OperationType.FORK:
-                    execution = self.fork(
-                        req.execution_id, req.checkpoint_id, req.new_state, graph=graph
-                    )
-                    results.append(BatchOperationResult(
-                        execution_id=req.execution_id,
-                        checkpoint_id=req.checkpoint_id,
-                        operation=req.operation,
-                        success=True,
-                        result_execution=execution,
-                        new_execution_id=execution.id,
-                    ))
+                    if detailed_audit:
+                        pending_events.extend(events)
+                    else:
+                        for event in events:
+                            audit_ops[event.event_type].append(event.payload)
                     
-                elif req.operation == OperationType.ROLLBACK_AND_RUN:
-                    if not req.graph:
-                        raise ValueError("Graph required for ROLLBACK_AND_RUN")
-                    execution = self.rollback_and_run(
-                        req.execution_id, req.checkpoint_id, req.graph
-                    )
-                    results.append(BatchOperationResult(
-                        execution_id=req.execution_id,
-                        checkpoint_id=req.checkpoint_id,
-                        operation=req.operation,
-                        success=True,
-                        result_execution=execution,
-                    ))
+                    if req.operation == OperationType.ROLLBACK_AND_RUN:
+                        post_commit_restores.append((
+                            self._extract_file_commit_id(execution),
+                            req.execution_id,
+                            req.checkpoint_id,
+                        ))
                     
-                elif req.operation == OperationType.FORK_AND_RUN:
-                    if not req.graph:
-                        raise ValueError("Graph required for FORK_AND_RUN")
-                    execution = self.fork_and_run(
-                        req.execution_id, req.checkpoint_id, req.graph, req.new_state
-                    )
+                    is_fork = self._handlers[req.operation][1]
                     results.append(BatchOperationResult(
                         execution_id=req.execution_id,
                         checkpoint_id=req.checkpoint_id,
                         operation=req.operation,
                         success=True,
                         result_execution=execution,
-                        new_execution_id=execution.id,
+                        new_execution_id=execution.id if is_fork else None,
                     ))
-                    
-            except Exception as e:
-                logger.error(f"Batch operation failed for {req.execution_id}: {e}")
-                results.append(BatchOperationResult(
-                    execution_id=req.execution_id,
-                    checkpoint_id=req.checkpoint_id,
-                    operation=req.operation,
-                    success=False,
-                    error=str(e),
-                ))
-                if stop_on_error:
-                    break
+                
+                # One summary audit event per operation kind
+                for event_type, operations in audit_ops.items():
+                    if operations:
+                        pending_events.append(OutboxEvent.create_batch_audit(
+                            event_type=self._BATCH_AUDIT_TYPES[event_type],
+                            batch_id=batch_id,
+                            operations=operations,
+                        ))
+                
+                # One coalesced file restore event for every rollback in the batch
+                if restores:
+                    pending_events.append(OutboxEvent.create_rollback_file_restore_batch(
+                        batch_id=batch_id,
+                        restores=restores,
+                        **self._rollback_cleanup_options(),
+                    ))
+                
+                # One batched outbox write for the whole batch
+                uow.outbox.add_many(pending_events)
+                uow.commit()
+            
+        except Exception as e:
+            # UoW __exit__ has already rolled the transaction back
+            logger.error(
+                f"Atomic batch rolled back at request {len(results)}/{len(requests)}: {e}"
+            )
+            raise BatchOperationError(
+                f"Atomic batch rolled back: {e}",
+                self._aborted_results(requests, results),
+            ) from e
+        
+        # Sequential, in request order: executions may share an output
+        # workspace, so a later restore must win over an earlier one
+        for file_commit_id, execution_id, checkpoint_id in post_commit_restores:
+            self._restore_files_post_commit(
+                file_commit_id=file_commit_id,
+                execution_id=execution_id,
+                checkpoint_id=checkpoint_id,
+                operation="rollback_and_run",
+            )
         
         return results
     
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Async API (IAsyncBatchExecutionCoordinator)
+    # ═══════════════════════════════════════════════════════════════════════════
+    
+    async def arollback(
+        self,
+        execution_id: str,
+        checkpoint_id: str,
+        graph: Optional[Any] = None,
+    ) -> "Execution":
+        """Async rollback - runs the sync UoW in a worker thread."""
+        return await asyncio.to_thread(self.rollback, execution_id, checkpoint_id, graph)
+    
+    async def afork(
+        self,
+        execution_id: str,
+        checkpoint_id: str,
+        new_state: Optional[Dict[str, Any]] = None,
+        graph: Optional[Any] = None,
+    ) -> "Execution":
+        """Async fork - runs the sync UoW in a worker thread."""
+        return await asyncio.to_thread(
+            self.fork, execution_id, checkpoint_id, new_state, graph
+        )
+    
+    async def arollback_and_run(
+        self,
+        execution_id: str,
+        checkpoint_id: str,
+        graph: Any,
+    ) -> "Execution":
+        """Async rollback and run - runs the sync UoW in a worker thread."""
+        return await asyncio.to_thread(
+            self.rollback_and_run, execution_id, checkpoint_id, graph
+        )
+    
+    async def afork_and_run(
+        self,
+        execution_id: str,
+        checkpoint_id: str,
+        graph: Any,
+        new_state: Optional[Dict[str, Any]] = None,
+    ) -> "Execution":
+        """Async fork and run - runs the sync UoW in a worker thread."""
+        return await asyncio.to_thread(
+            self.fork_and_run, execution_id, checkpoint_id, graph, new_state
+        )
+    
+    async def abatch_operate(
+        self,
+        requests: List[BatchOperationRequest],
+        max_concurrency: int = 4,
+        stop_on_error: bool = False,
+        *,
+        graph: Optional[Any] = None,
+    ) -> List[BatchOperationResult]:
+        """
+        Execute batch operations without blocking the event loop.
+        
+        Async counterpart of batch_operate() for API routes. Each request
+        still runs in its own sync UoW, dispatched to a worker thread via
+        asyncio.to_thread(); at most max_concurrency run at once so the
+        DB connection pool is not exhausted. The StateAdapter must be
+        thread-safe when max_concurrency > 1.
+        
+        Overrides the interface default to reuse the sync dispatch table
+        (including the graph passed to ROLLBACK/FORK).
+        
+        Args:
+            requests: List of operation requests
+            max_concurrency: Maximum requests in flight
+            stop_on_error: If True, requests still waiting for the semaphore
+                           when a failure is seen are skipped and left out
+                           of the results; requests in flight complete.
+            graph: Optional LangGraph graph for state adapter (v1.8),
+                   keyword-only so positional calls match the interface
+            
+        Returns:
+            List of results (same order as requests)
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        stop = asyncio.Event()
+        
+        async def dispatch(req: BatchOperationRequest) -> Optional[BatchOperationResult]:
+            async with semaphore:
+                if stop.is_set():
+                    return None
+                result = await asyncio.to_thread(self._dispatch_single, req, graph)
+                if stop_on_error and not result.success:
+                    stop.set()
+                return result
+        
+        # _dispatch_single never raises, so gather() needs no return_exceptions
+        with self._graph_scope():
+            results = await asyncio.gather(*(dispatch(req) for req in requests))
+        return [result for result in results if result is not None]
+    
     # ═══════════════════════════════════════════════════════════════════════════
     # Convenience Methods
     # ═══════════════════════════════════════════════════════════════════════════
@@ -656,15 +964,9 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
         Returns:
             List of BatchOperationResult
         """
-        requests = [
-            BatchOperationRequest(
-                execution_id=exec_id,
-                checkpoint_id=cp_id,
-                operation=OperationType.ROLLBACK,
-            )
-            for exec_id, cp_id in items
-        ]
-        return self.batch_operate(requests)
+        return self.batch_operate(
+            BatchOperationRequest.bulk_from_tuples(items, OperationType.ROLLBACK)
+        )
     
     def batch_fork(
         self,
@@ -680,40 +982,389 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
         Returns:
             List of BatchOperationResult
         """
-        requests = []
-        for item in items:
-            exec_id, cp_id = item[0], item[1]
-            new_state = item[2] if len(item) > 2 else None
-            requests.append(BatchOperationRequest(
-                execution_id=exec_id,
-                checkpoint_id=cp_id,
-                operation=OperationType.FORK,
-                new_state=new_state,
-            ))
-        return self.batch_operate(requests)
+        return self.batch_operate(
+            BatchOperationRequest.bulk_from_tuples(items, OperationType.FORK)
+        )
+    
+    def shutdown(self) -> None:
+        """Wait for pending background file restores and stop the executor."""
+        if self._post_commit_executor is not None:
+            self._post_commit_executor.shutdown(wait=True)
+            self._post_commit_executor = None
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Private Helpers
     # ═══════════════════════════════════════════════════════════════════════════
     
+    def _create_controller(self, uow: "IUnitOfWork") -> "IExecutionController":
+        """
+        Create a controller bound to uow and the shared adapters.
+        
+        The controller's own commits are deferred: the caller commits uow
+        once its outbox events are queued.
+        """
+        return self._controller_factory.create(
+            uow=_DeferredCommitUnitOfWork(uow),
+            state_adapter=self._state_adapter,
+            file_tracking_service=self._file_tracking,
+        )
+    
+    def _run_in_uow(
+        self,
+        op: Callable[["IExecutionController"], Tuple[Any, List[OutboxEvent]]],
+        operation: str,
+        execution_id: str,
+    ) -> Any:
+        """
+        Run op in a fresh UoW, queue its outbox events and commit.
+        
+        op receives a controller bound to the UoW and returns
+        (result, events). The UoW context manager rolls back if op or
+        commit() raises.
+        
+        Returns:
+            The result returned by op
+        """
+        try:
+            with self._uow_factory() as uow:
+                result, events = op(self._create_controller(uow))
+                uow.outbox.add_many(events)
+                uow.commit()
+        except Exception as e:
+            logger.error(f"{operation} failed for {execution_id}: {e}")
+            raise
+        return result
+    
+    @contextmanager
+    def _graph_scope(self) -> Iterator[None]:
+        """
+        Let _ensure_graph() reuse the compiled graph for one batch call.
+        
+        The cache lives only while a batch call is open; outside one, every
+        operation recompiles its graph as set_workflow_graph() always did.
+        """
+        with self._graph_lock:
+            self._graph_scopes += 1
+        try:
+            yield
+        finally:
+            with self._graph_lock:
+                self._graph_scopes -= 1
+                if not self._graph_scopes:
+                    self._current_graph = None
+    
+    def _ensure_graph(self, graph: Optional[Any]) -> None:
+        """
+        Set graph on the state adapter (force recompile).
+        
+        Inside a batch call (_graph_scope), a graph that is already the
+        active one is not recompiled, so batches sharing one graph compile
+        it once instead of per operation.
+        """
+        if not graph or self._set_graph is None:
+            return
+        with self._graph_lock:
+            if self._graph_scopes and graph is self._current_graph:
+                return
+            self._set_graph(graph, force_recompile=True)
+            if self._graph_scopes:
+                self._current_graph = graph
+        logger.debug("Set graph on state adapter")
+    
+    def _invalidate_graph(self) -> None:
+        """Forget the active graph (the adapter is about to be given another)."""
+        with self._graph_lock:
+            self._current_graph = None
+    
+    def _build_rollback_events(
+        self,
+        execution_id: str,
+        checkpoint_id: str,
+        file_commit_id: Optional[str],
+    ) -> List[OutboxEvent]:
+        """
+        Build outbox events for a rollback.
+        
+        Always contains the ROLLBACK_PERFORMED audit event; adds a
+        ROLLBACK_FILE_RESTORE event when there are files to restore so the
+        OutboxProcessor coordinates restoration.
+        """
+        events = [self._build_rollback_audit_event(
+            execution_id, checkpoint_id, file_commit_id
+        )]
+        
+        restore = self._file_restore_entry(execution_id, checkpoint_id, file_commit_id)
+        if restore is not None:
+            # restore is a fresh dict, so extend it in place instead of copying
+            restore.update(self._rollback_cleanup_options())
+            events.append(OutboxEvent.create(
+                event_type=OutboxEventType.ROLLBACK_FILE_RESTORE,
+                aggregate_id=execution_id,
+                aggregate_type="Execution",
+                payload=restore,
+            ))
+            logger.debug("Queued file restore for commit %s", file_commit_id)
+        
+        return events
+    
+    def _build_rollback_audit_event(
+        self,
+        execution_id: str,
+        checkpoint_id: str,
+        file_commit_id: Optional[str],
+    ) -> OutboxEvent:
+        """Build the ROLLBACK_PERFORMED audit event."""
+        return OutboxEvent.create(
+            event_type=OutboxEventType.ROLLBACK_PERFORMED,
+            aggregate_id=execution_id,
+            aggregate_type="Execution",
+            payload={
+                "execution_id": execution_id,
+                "checkpoint_id": checkpoint_id,
+                "file_commit_id": file_commit_id,
+                "operation": "rollback",
+            },
+        )
+    
+    def _file_restore_entry(
+        self,
+        execution_id: str,
+        checkpoint_id: str,
+        file_commit_id: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Base ROLLBACK_FILE_RESTORE payload, or None if nothing to restore.
+        """
+        if not file_commit_id or not self._file_tracking:
+            return None
+        return {
+            "source_checkpoint_id": checkpoint_id,
+            "target_checkpoint_id": checkpoint_id,
+            "source_commit_id": file_commit_id,
+            "execution_id": execution_id,
+        }
+    
+    def _rollback_cleanup_options(self) -> Dict[str, Any]:
+        """
+        v1.9: Cleanup configuration for file restore payloads (empty if disabled).
+        
+        Derived from config only, so it is built once and shared by every
+        payload; callers merge it into a new dict and must not mutate it.
+        """
+        if self._cleanup_options is None:
+            self._cleanup_options = self._build_cleanup_options()
+        return self._cleanup_options
+    
+    def _build_cleanup_options(self) -> Dict[str, Any]:
+        """Build the v1.9 cleanup options from config."""
+        if not (self._config and self._config.rollback_cleanup_enabled):
+            return {}
+        
+        options: Dict[str, Any] = {
+            "cleanup_orphaned_files": True,
+            "cleanup_dry_run": self._config.rollback_cleanup_dry_run,
+            "cleanup_backup": self._config.rollback_cleanup_backup,
+            "cleanup_max_files": self._config.rollback_cleanup_max_files,
+        }
+        
+        # Add workspace path and patterns from file_tracking_config
+        if self._config.file_tracking_config:
+            ft_cfg = self._config.file_tracking_config
+            options.update({
+                "workspace_path": str(ft_cfg.workspace_path) if ft_cfg.workspace_path else ".",
+                "track_patterns": ft_cfg.auto_track_patterns or [],
+                "exclude_patterns": ft_cfg.exclude_patterns or [],
+            })
+        
+        logger.debug(
+            "Rollback cleanup enabled: dry_run=%s, backup=%s, max_files=%s",
+            self._config.rollback_cleanup_dry_run,
+            self._config.rollback_cleanup_backup,
+            self._config.rollback_cleanup_max_files,
+        )
+        return options
+    
+    def _build_fork_event(
+        self,
+        execution_id: str,
+        checkpoint_id: str,
+        forked: "Execution",
+        new_state: Optional[Dict[str, Any]],
+    ) -> OutboxEvent:
+        """Build the EXECUTION_FORKED audit event."""
+        return OutboxEvent.create(
+            event_type=OutboxEventType.EXECUTION_FORKED,
+            aggregate_id=forked.id,
+            aggregate_type="Execution",
+            payload={
+                "source_execution_id": execution_id,
+                "fork_execution_id": forked.id,
+                "source_checkpoint_id": checkpoint_id,
+                "new_state_keys": list(new_state.keys()) if new_state else [],
+            },
+        )
+    
+    def _build_rollback_and_run_event(
+        self,
+        execution_id: str,
+        checkpoint_id: str,
+        execution: "Execution",
+        file_commit_id: Optional[str],
+    ) -> OutboxEvent:
+        """Build the single audit event for a rollback + continued run."""
+        return OutboxEvent.create(
+            event_type=OutboxEventType.ROLLBACK_PERFORMED,
+            aggregate_id=execution_id,
+            aggregate_type="Execution",
+            payload={
+                "execution_id": execution_id,
+                "checkpoint_id": checkpoint_id,
+                "continued": True,
+                "final_status": execution.status.value,
+                "file_commit_id": file_commit_id,
+            },
+        )
+    
+    def _build_fork_and_run_event(
+        self,
+        execution_id: str,
+        checkpoint_id: str,
+        forked: "Execution",
+        result: "Execution",
+    ) -> OutboxEvent:
+        """Build the EXECUTION_FORKED audit event for a fork + run."""
+        return OutboxEvent.create(
+            event_type=OutboxEventType.EXECUTION_FORKED,
+            aggregate_id=forked.id,
+            aggregate_type="Execution",
+            payload={
+                "source_execution_id": execution_id,
+                "fork_execution_id": forked.id,
+                "source_checkpoint_id": checkpoint_id,
+                "ran_immediately": True,
+                "final_status": result.status.value,
+            },
+        )
+    
+    def _apply_in_uow(
+        self,
+        controller: "IExecutionController",
+        req: BatchOperationRequest,
+        restores: List[Dict[str, Any]],
+    ) -> tuple:
+        """
+        Apply one request on an existing controller without committing.
+        
+        Rollback file restores are appended to restores instead of being
+        emitted as per-request events, so the caller can coalesce them.
+        
+        Returns:
+            (execution, outbox events) - forks return the NEW execution
+        """
+        apply = self._apply_handlers.get(req.operation)
+        if apply is None:
+            raise ValueError(f"Unsupported operation: {req.operation}")
+        return apply(controller, req, restores)
+    
+    def _apply_rollback(
+        self,
+        controller: "IExecutionController",
+        req: BatchOperationRequest,
+        restores: List[Dict[str, Any]],
+    ) -> tuple:
+        execution = controller.rollback(req.execution_id, req.checkpoint_id)
+        file_commit_id = self._extract_file_commit_id(execution)
+        restore = self._file_restore_entry(
+            req.execution_id, req.checkpoint_id, file_commit_id
+        )
+        if restore is not None:
+            restores.append(restore)
+        return execution, [self._build_rollback_audit_event(
+            req.execution_id, req.checkpoint_id, file_commit_id
+        )]
+    
+    def _apply_fork(
+        self,
+        controller: "IExecutionController",
+        req: BatchOperationRequest,
+        restores: List[Dict[str, Any]],
+    ) -> tuple:
+        forked = controller.fork(req.execution_id, req.checkpoint_id, req.new_state)
+        return forked, [self._build_fork_event(
+            req.execution_id, req.checkpoint_id, forked, req.new_state
+        )]
+    
+    def _apply_rollback_and_run(
+        self,
+        controller: "IExecutionController",
+        req: BatchOperationRequest,
+        restores: List[Dict[str, Any]],
+    ) -> tuple:
+        if not req.graph:
+            raise ValueError("Graph required for ROLLBACK_AND_RUN")
+        self._invalidate_graph()
+        execution = controller.rollback(req.execution_id, req.checkpoint_id)
+        file_commit_id = self._extract_file_commit_id(execution)
+        execution = controller.run(req.execution_id, graph=req.graph)
+        return execution, [self._build_rollback_and_run_event(
+            req.execution_id, req.checkpoint_id, execution, file_commit_id
+        )]
+    
+    def _apply_fork_and_run(
+        self,
+        controller: "IExecutionController",
+        req: BatchOperationRequest,
+        restores: List[Dict[str, Any]],
+    ) -> tuple:
+        if not req.graph:
+            raise ValueError("Graph required for FORK_AND_RUN")
+        self._invalidate_graph()
+        forked = controller.fork(req.execution_id, req.checkpoint_id, req.new_state)
+        result = controller.run(forked.id, graph=req.graph)
+        return result, [self._build_fork_and_run_event(
+            req.execution_id, req.checkpoint_id, forked, result
+        )]
+    
+    @staticmethod
+    def _aborted_results(
+        requests: List[BatchOperationRequest],
+        processed: List[BatchOperationResult],
+    ) -> List[BatchOperationResult]:
+        """Per-request status for a rolled-back atomic batch."""
+        results: List[BatchOperationResult] = []
+        for index, req in enumerate(requests):
+            if index < len(processed) and not processed[index].success:
+                results.append(processed[index])
+                continue
+            results.append(BatchOperationResult(
+                execution_id=req.execution_id,
+                checkpoint_id=req.checkpoint_id,
+                operation=req.operation,
+                success=False,
+                error=(
+                    "Rolled back: batch aborted" if index < len(processed)
+                    else "Not processed: batch aborted"
+                ),
+            ))
+        return results
+    
     def _extract_file_commit_id(self, execution: "Execution") -> Optional[str]:
         """Extract file_commit_id from execution state if available."""
         if not execution or not execution.state:
             return None
         
-        # Try multiple possible locations
-        workflow_vars = getattr(execution.state, 'workflow_variables', {})
+        # ExecutionState always declares workflow_variables
+        workflow_vars = execution.state.workflow_variables
         
         # Location 1: _file_tracking_result.commit_id
-        ft_result = workflow_vars.get("_file_tracking_result", {})
-        if isinstance(ft_result, dict) and ft_result.get("commit_id"):
-            return ft_result["commit_id"]
+        ft_result = workflow_vars.get("_file_tracking_result")
+        if isinstance(ft_result, dict):
+            commit_id = ft_result.get("commit_id")
+            if commit_id:
+                return commit_id
         
         # Location 2: Direct file_commit_id
-        if workflow_vars.get("file_commit_id"):
-            return workflow_vars["file_commit_id"]
-        
-        return None
+        return workflow_vars.get("file_commit_id") or None
     
     def _restore_files_post_commit(
         self,
@@ -732,17 +1383,53 @@ class BatchExecutionCoordinator(IBatchExecutionCoordinator):
             return
         
         if not self._file_tracking.is_available():
-            logger.debug(f"File tracking not available for {operation}")
+            logger.debug("File tracking not available for %s", operation)
             return
         
+        executor = self._post_commit_executor
+        if executor is not None:
+            try:
+                future = executor.submit(
+                    self._file_tracking.restore_commit, file_commit_id
+                )
+            except RuntimeError:
+                # shutdown() won the race; restore synchronously instead
+                pass
+            else:
+                future.add_done_callback(
+                    lambda f: self._log_restore_outcome(f, operation, execution_id, checkpoint_id)
+                )
+                return
+        
         try:
             result = self._file_tracking.restore_commit(file_commit_id)
-            logger.info(
-                f"Restored {result.files_restored} files for "
-                f"{operation} {execution_id} -> {checkpoint_id[:8]}..."
-            )
         except Exception as e:
             # Log but don't fail - outbox processor will retry
             logger.warning(
-                f"File restore failed for {operation} (will retry via outbox): {e}"
+                "File restore failed for %s (will retry via outbox): %s", operation, e
+            )
+            return
+        logger.info(
+            "Restored %s files for %s %s -> %.8s...",
+            result.files_restored, operation, execution_id, checkpoint_id,
+        )
+    
+    @staticmethod
+    def _log_restore_outcome(
+        future: "Future",
+        operation: str,
+        execution_id: str,
+        checkpoint_id: str,
+    ) -> None:
+        """Done-callback for background file restores."""
+        error = future.exception()
+        if error is not None:
+            # Log but don't fail - outbox processor will retry
+            logger.warning(
+                "File restore failed for %s (will retry via outbox): %s", operation, error
             )
+            return
+        logger.info(
+            "Restored %s files for %s %s -> %.8s...",
+            future.result().files_restored, operation, execution_id, checkpoint_id,
+        )
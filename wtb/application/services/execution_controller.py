@@ -12,8 +12,10 @@ Orchestrates workflow execution with support for:
 - Fork operations (moved from SDK)
 """
 
+import json
 import logging
 import uuid
+from pathlib import Path
 from typing import Optional, Dict, Any, List, TYPE_CHECKING
 from datetime import datetime
 
@@ -297,9 +299,6 @@ class ExecutionController(IExecutionController):
     
     def _track_output_files(self, execution: Execution, final_state: Any) -> None:
         """Write output files to disk and track them."""
-        import os
-        from pathlib import Path
-        
         if not isinstance(final_state, dict):
             return
         
@@ -341,7 +340,6 @@ class ExecutionController(IExecutionController):
                 elif isinstance(content, str):
                     file_path.write_text(content, encoding="utf-8")
                 else:
-                    import json
                     file_path.write_text(json.dumps(content, indent=2), encoding="utf-8")
                 
                 written_paths.append(str(file_path.absolute()))
@@ -543,9 +541,6 @@ class ExecutionController(IExecutionController):
         files_restored_count = 0
         if self._file_tracking and self._file_tracking.is_available() and self._output_dir:
             try:
-                import json
-                from pathlib import Path
-                
                 output_files_data = None
                 if isinstance(restored_state, dict):
                     output_files_data = restored_state.get("_output_files")
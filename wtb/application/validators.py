@@ -13,9 +13,11 @@ Design:
 - UUID validation for execution_id, checkpoint_id, etc.
 """
 
+import functools
+import operator
 import re
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import AbstractSet, Any, Collection, Dict, Iterable, List, Optional
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -25,9 +27,26 @@ from typing import Any, Dict, List, Optional
 
 UUID_PATTERN = re.compile(
     r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
-    re.IGNORECASE
+    re.IGNORECASE | re.ASCII
 )
 
+_HEX_DIGITS = b'0123456789abcdefABCDEF'
+
+
+def _is_uuid_fast(value: str) -> bool:
+    """
+    Straight-line equivalent of UUID_PATTERN.match for stripped strings.
+    
+    Checks the fixed 8-4-4-4-12 shape, then deletes every hex digit in
+    one bytes.translate() pass: a UUID leaves exactly the four dashes.
+    """
+    return (
+        len(value) == 36
+        and value[8] == value[13] == value[18] == value[23] == '-'
+        and value.isascii()
+        and value.encode('ascii').translate(None, _HEX_DIGITS) == b'----'
+    )
+
 
 def validate_uuid(value: str, field_name: str = "id", strict: bool = False) -> str:
     """
@@ -56,6 +75,18 @@ def validate_uuid(value: str, field_name: str = "id", strict: bool = False) -> s
     if not isinstance(value, str):
         raise ValueError(f"{field_name} must be a string")
     
+    return _validate_uuid_cached(value, field_name, strict)
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_uuid_cached(value: str, field_name: str, strict: bool) -> str:
+    """
+    Memoized body of validate_uuid for non-empty string values.
+    
+    The same IDs are validated on every request of a session; results
+    are deterministic, so repeats become a cache hit. Failures raise and
+    are therefore never cached.
+    """
     # Accept both with and without dashes
     normalized = value.strip()
     
@@ -74,6 +105,15 @@ def validate_uuid(value: str, field_name: str = "id", strict: bool = False) -> s
     return normalized
 
 
+# Lets tests reset memoized validations
+validate_uuid.cache_clear = _validate_uuid_cached.cache_clear
+
+
+# The ID validators below inline validate_uuid's guards and call the
+# memoized body directly; invalid input takes the validate_uuid path so
+# error messages stay identical.
+
+
 def validate_execution_id(execution_id: str, strict: bool = False) -> str:
     """
     Validate execution ID.
@@ -85,7 +125,9 @@ def validate_execution_id(execution_id: str, strict: bool = False) -> str:
     Returns:
         Validated execution ID string
     """
-    return validate_uuid(execution_id, "execution_id", strict=strict)
+    if not execution_id or not isinstance(execution_id, str):
+        return validate_uuid(execution_id, "execution_id", strict=strict)
+    return _validate_uuid_cached(execution_id, "execution_id", strict)
 
 
 def validate_checkpoint_id(checkpoint_id: str, strict: bool = False) -> str:
@@ -94,17 +136,41 @@ def validate_checkpoint_id(checkpoint_id: str, strict: bool = False) -> str:
     
     Note: LangGraph uses various checkpoint ID formats, so strict=False by default.
     """
-    return validate_uuid(checkpoint_id, "checkpoint_id", strict=strict)
+    if not checkpoint_id or not isinstance(checkpoint_id, str):
+        return validate_uuid(checkpoint_id, "checkpoint_id", strict=strict)
+    return _validate_uuid_cached(checkpoint_id, "checkpoint_id", strict)
 
 
 def validate_workflow_id(workflow_id: str, strict: bool = False) -> str:
     """Validate workflow ID."""
-    return validate_uuid(workflow_id, "workflow_id", strict=strict)
+    if not workflow_id or not isinstance(workflow_id, str):
+        return validate_uuid(workflow_id, "workflow_id", strict=strict)
+    return _validate_uuid_cached(workflow_id, "workflow_id", strict)
 
 
 def validate_batch_test_id(batch_test_id: str, strict: bool = False) -> str:
     """Validate batch test ID."""
-    return validate_uuid(batch_test_id, "batch_test_id", strict=strict)
+    if not batch_test_id or not isinstance(batch_test_id, str):
+        return validate_uuid(batch_test_id, "batch_test_id", strict=strict)
+    return _validate_uuid_cached(batch_test_id, "batch_test_id", strict)
+
+
+def validate_execution_ids(execution_ids: Iterable[str], strict: bool = False) -> List[str]:
+    """
+    Validate many execution IDs in one call.
+    
+    Args:
+        execution_ids: Execution IDs to validate
+        strict: If True, require UUID format
+        
+    Returns:
+        Validated execution IDs, in input order
+        
+    Raises:
+        ValueError: On the first invalid ID
+    """
+    validate = validate_execution_id
+    return [validate(execution_id, strict) for execution_id in execution_ids]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -140,6 +206,15 @@ def validate_string(
             raise ValueError(f"{field_name} is required")
         return None
     
+    # Fast path: already-trimmed, non-empty string within bounds
+    if (
+        type(value) is str
+        and value
+        and min_length <= len(value) <= max_length
+        and value.strip() == value
+    ):
+        return value
+    
     if not isinstance(value, str):
         raise ValueError(f"{field_name} must be a string")
     
@@ -157,14 +232,53 @@ def validate_string(
     return stripped if stripped else None
 
 
+# validate_node_id / validate_reason are validate_string with their bounds
+# written in: same checks, order and messages, minus the trivial ones.
+
+
 def validate_node_id(node_id: str, required: bool = True) -> Optional[str]:
     """Validate node ID."""
-    return validate_string(node_id, "node_id", min_length=1, max_length=256, required=required)
+    if node_id is None:
+        if required:
+            raise ValueError("node_id is required")
+        return None
+    
+    if not isinstance(node_id, str):
+        raise ValueError("node_id must be a string")
+    
+    stripped = node_id.strip()
+    
+    if not stripped and required:
+        raise ValueError("node_id cannot be empty")
+    
+    if not stripped:
+        raise ValueError("node_id must be at least 1 characters")
+    
+    if len(stripped) > 256:
+        raise ValueError("node_id exceeds maximum length of 256 characters")
+    
+    return stripped
 
 
 def validate_reason(reason: str, required: bool = False) -> Optional[str]:
     """Validate reason string."""
-    return validate_string(reason, "reason", max_length=1000, required=required)
+    if reason is None:
+        if required:
+            raise ValueError("reason is required")
+        return None
+    
+    if not isinstance(reason, str):
+        raise ValueError("reason must be a string")
+    
+    stripped = reason.strip()
+    
+    if not stripped and required:
+        raise ValueError("reason cannot be empty")
+    
+    if len(stripped) > 1000:
+        raise ValueError("reason exceeds maximum length of 1000 characters")
+    
+    return stripped if stripped else None
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -181,12 +295,15 @@ def validate_limit(limit: int, max_limit: int = 1000) -> int:
         max_limit: Maximum allowed limit
         
     Returns:
-        Validated limit value
+        Validated limit value (as a plain int; int-likes such as
+        numpy integers are accepted via __index__)
         
     Raises:
         ValueError: If limit is invalid
     """
-    if not isinstance(limit, int):
+    try:
+        limit = operator.index(limit)
+    except TypeError:
         raise ValueError("limit must be an integer")
     
     if limit < 1:
@@ -206,12 +323,14 @@ def validate_offset(offset: int) -> int:
         offset: Offset value to validate
         
     Returns:
-        Validated offset value
+        Validated offset value (as a plain int)
         
     Raises:
         ValueError: If offset is invalid
     """
-    if not isinstance(offset, int):
+    try:
+        offset = operator.index(offset)
+    except TypeError:
         raise ValueError("offset must be an integer")
     
     if offset < 0:
@@ -238,14 +357,14 @@ def validate_state_changes(changes: Dict[str, Any]) -> Dict[str, Any]:
     Raises:
         ValueError: If changes are invalid
     """
-    if not changes:
-        raise ValueError("changes cannot be empty")
-    
     if not isinstance(changes, dict):
         raise ValueError("changes must be a dictionary")
     
-    # Validate key names
-    for key in changes.keys():
+    if not changes:
+        raise ValueError("changes cannot be empty")
+    
+    # Validate key names (single pass, fails on the first bad key)
+    for key in changes:
         if not isinstance(key, str):
             raise ValueError(f"State key must be a string, got {type(key).__name__}")
         if not key.strip():
@@ -256,13 +375,14 @@ def validate_state_changes(changes: Dict[str, Any]) -> Dict[str, Any]:
     return changes
 
 
-def validate_status(status: str, allowed_statuses: List[str]) -> str:
+def validate_status(status: str, allowed_statuses: Collection[str]) -> str:
     """
     Validate status string against allowed values.
     
     Args:
         status: Status to validate
-        allowed_statuses: List of allowed status values
+        allowed_statuses: Allowed status values. Pass a module-level
+                          frozenset for O(1) membership on hot paths.
         
     Returns:
         Validated status string
@@ -274,8 +394,14 @@ def validate_status(status: str, allowed_statuses: List[str]) -> str:
         raise ValueError("status is required")
     
     if status not in allowed_statuses:
+        # Sets have no order; sort them so the message is stable
+        allowed = (
+            sorted(allowed_statuses)
+            if isinstance(allowed_statuses, AbstractSet)
+            else allowed_statuses
+        )
         raise ValueError(
-            f"Invalid status '{status}'. Allowed: {', '.join(allowed_statuses)}"
+            f"Invalid status '{status}'. Allowed: {', '.join(allowed)}"
         )
     
     return status
@@ -296,11 +422,18 @@ class ValidationError(ValueError):
         value: The invalid value (optional)
     """
     
+    # Attributes live in slots; BaseException's __dict__ is never materialized
+    __slots__ = ("field", "message", "value")
+    
     def __init__(self, message: str, field: str = None, value: Any = None):
         super().__init__(message)
         self.field = field
         self.message = message
         self.value = value
+    
+    def __reduce__(self):
+        # BaseException pickles args + __dict__ only, which would drop the slots
+        return (type(self), (self.message, self.field, self.value))
 
 
 def validate_execution_request(
@@ -344,6 +477,9 @@ def validate_execution_request(
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+_IDEMPOTENCY_KEY_PATTERN = re.compile(r'^[a-zA-Z0-9_\-:.]+$', re.ASCII)
+
+
 def validate_idempotency_key(key: Optional[str]) -> Optional[str]:
     """
     Validate and normalize idempotency key.
@@ -392,11 +528,11 @@ def validate_idempotency_key(key: Optional[str]) -> Optional[str]:
         raise ValueError("idempotency_key exceeds maximum length of 256 characters")
     
     # Allow UUID format or custom format
-    if UUID_PATTERN.match(key):
+    if _is_uuid_fast(key):
         return key.lower()
     
     # For custom formats, ensure alphanumeric with limited special chars
-    if not re.match(r'^[a-zA-Z0-9_\-:.]+$', key):
+    if not _IDEMPOTENCY_KEY_PATTERN.match(key):
         raise ValueError(
             "idempotency_key must contain only alphanumeric characters, "
             "underscores, hyphens, colons, and periods"
@@ -412,6 +548,7 @@ __all__ = [
     "validate_checkpoint_id",
     "validate_workflow_id",
     "validate_batch_test_id",
+    "validate_execution_ids",
     # String validators
     "validate_string",
     "validate_node_id",
@@ -30,6 +30,7 @@ Usage:
     config = WTBConfig.from_env()
 """
 
+import functools
 import os
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
@@ -358,7 +359,30 @@ class FileTrackingConfig:
 # ═══════════════════════════════════════════════════════════════
 
 
-@dataclass
+# Environment variables read by WTBConfig.from_env()
+_WTB_ENV_KEYS = (
+    "WTB_STORAGE_MODE",
+    "WTB_DATABASE_URL",
+    "AGENTGIT_DB_PATH",
+    "STATE_ADAPTER_MODE",
+    "WTB_DATA_DIR",
+    "FILETRACKER_ENABLED",
+    "FILETRACKER_STORAGE",
+    "IDE_SYNC_ENABLED",
+    "IDE_SYNC_URL",
+    "WTB_LOG_SQL",
+    "WTB_LOG_LEVEL",
+    "WTB_ROLLBACK_CLEANUP_ENABLED",
+    "WTB_ROLLBACK_CLEANUP_DRY_RUN",
+    "WTB_ROLLBACK_CLEANUP_BACKUP",
+    "WTB_ROLLBACK_CLEANUP_MAX_FILES",
+)
+
+# Values accepted as True for boolean environment variables
+_TRUTHY = frozenset(("true", "True", "TRUE", "1", "yes", "on"))
+
+
+@dataclass(frozen=True, slots=True)
 class WTBConfig:
     """
     WTB configuration with storage options.
@@ -434,7 +458,8 @@ class WTBConfig:
     def __post_init__(self):
         """Set default wtb_db_url if not provided."""
         if self.wtb_db_url is None and self.wtb_storage_mode == "sqlalchemy":
-            self.wtb_db_url = f"sqlite:///{self.data_dir}/wtb.db"
+            # Frozen dataclass: bypass __setattr__ for the derived default
+            object.__setattr__(self, "wtb_db_url", f"sqlite:///{self.data_dir}/wtb.db")
     
     @classmethod
     def from_env(cls) -> "WTBConfig":
@@ -458,28 +483,42 @@ class WTBConfig:
             WTB_ROLLBACK_CLEANUP_BACKUP: Backup before delete (default: "true")
             WTB_ROLLBACK_CLEANUP_MAX_FILES: Max files to delete (default: "100")
         
+        Boolean variables accept "true", "True", "TRUE", "1", "yes" or "on".
+        
         Returns:
-            WTBConfig instance
+            WTBConfig instance (shared while the environment is unchanged)
         """
-        data_dir = os.getenv("WTB_DATA_DIR", "data")
+        snapshot = tuple(os.environ.get(key) for key in _WTB_ENV_KEYS)
+        return cls._from_env_snapshot(snapshot)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _from_env_snapshot(cls, snapshot: tuple) -> "WTBConfig":
+        """Build config from the values of _WTB_ENV_KEYS (memoized)."""
+        env = {
+            key: value
+            for key, value in zip(_WTB_ENV_KEYS, snapshot)
+            if value is not None
+        }
+        data_dir = env.get("WTB_DATA_DIR", "data")
         
         return cls(
-            wtb_storage_mode=os.getenv("WTB_STORAGE_MODE", "inmemory"),
-            wtb_db_url=os.getenv("WTB_DATABASE_URL"),
-            agentgit_db_path=os.getenv("AGENTGIT_DB_PATH", f"{data_dir}/agentgit.db"),
-            state_adapter_mode=os.getenv("STATE_ADAPTER_MODE", "inmemory"),
+            wtb_storage_mode=env.get("WTB_STORAGE_MODE", "inmemory"),
+            wtb_db_url=env.get("WTB_DATABASE_URL"),
+            agentgit_db_path=env.get("AGENTGIT_DB_PATH", f"{data_dir}/agentgit.db"),
+            state_adapter_mode=env.get("STATE_ADAPTER_MODE", "inmemory"),
             data_dir=data_dir,
-            filetracker_enabled=os.getenv("FILETRACKER_ENABLED", "false").lower() == "true",
-            filetracker_storage_path=os.getenv("FILETRACKER_STORAGE"),
-            ide_sync_enabled=os.getenv("IDE_SYNC_ENABLED", "false").lower() == "true",
-            ide_sync_url=os.getenv("IDE_SYNC_URL"),
-            log_sql=os.getenv("WTB_LOG_SQL", "false").lower() == "true",
-            log_level=os.getenv("WTB_LOG_LEVEL", "INFO"),
+            filetracker_enabled=env.get("FILETRACKER_ENABLED", "false") in _TRUTHY,
+            filetracker_storage_path=env.get("FILETRACKER_STORAGE"),
+            ide_sync_enabled=env.get("IDE_SYNC_ENABLED", "false") in _TRUTHY,
+            ide_sync_url=env.get("IDE_SYNC_URL"),
+            log_sql=env.get("WTB_LOG_SQL", "false") in _TRUTHY,
+            log_level=env.get("WTB_LOG_LEVEL", "INFO"),
             # v1.9: Rollback cleanup options
-            rollback_cleanup_enabled=os.getenv("WTB_ROLLBACK_CLEANUP_ENABLED", "false").lower() == "true",
-            rollback_cleanup_dry_run=os.getenv("WTB_ROLLBACK_CLEANUP_DRY_RUN", "false").lower() == "true",
-            rollback_cleanup_backup=os.getenv("WTB_ROLLBACK_CLEANUP_BACKUP", "true").lower() == "true",
-            rollback_cleanup_max_files=int(os.getenv("WTB_ROLLBACK_CLEANUP_MAX_FILES", "100")),
+            rollback_cleanup_enabled=env.get("WTB_ROLLBACK_CLEANUP_ENABLED", "false") in _TRUTHY,
+            rollback_cleanup_dry_run=env.get("WTB_ROLLBACK_CLEANUP_DRY_RUN", "false") in _TRUTHY,
+            rollback_cleanup_backup=env.get("WTB_ROLLBACK_CLEANUP_BACKUP", "true") in _TRUTHY,
+            rollback_cleanup_max_files=int(env.get("WTB_ROLLBACK_CLEANUP_MAX_FILES", "100")),
         )
     
     @classmethod
@@ -70,10 +70,12 @@ from .batch_runner import (
 # Batch Coordinator (v1.8 - 2026-02-05)
 from .batch_coordinator import (
     IBatchExecutionCoordinator,
+    IAsyncBatchExecutionCoordinator,
     IExecutionControllerFactory,
     OperationType,
     BatchOperationRequest,
     BatchOperationResult,
+    BatchOperationError,
 )
 from .file_tracking import (
     IFileTrackingService,
@@ -173,10 +175,12 @@ __all__ = [
     "BatchRunnerExecutionError",
     # Batch Coordinator (v1.8)
     "IBatchExecutionCoordinator",
+    "IAsyncBatchExecutionCoordinator",
     "IExecutionControllerFactory",
     "OperationType",
     "BatchOperationRequest",
     "BatchOperationResult",
+    "BatchOperationError",
     # File Tracking (2026-01-15, renamed 2026-01-16)
     "IFileTrackingService",
     "IFileTrackingServiceFactory",
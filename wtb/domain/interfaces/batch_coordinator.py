@@ -54,6 +54,10 @@ Usage:
     ])
 """
 
+from __future__ import annotations
+
+import asyncio
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any, Callable, TYPE_CHECKING
@@ -80,7 +84,11 @@ class OperationType(Enum):
     FORK_AND_RUN = "fork_run"           # Fork + run new execution
 
 
-@dataclass
+# Serialized form of each OperationType, resolved once for to_dict()
+_OP_VALUES: Dict[OperationType, str] = {op: op.value for op in OperationType}
+
+
+@dataclass(frozen=True, slots=True)
 class BatchOperationRequest:
     """
     Request for a batch operation.
@@ -100,9 +108,34 @@ class BatchOperationRequest:
     operation: OperationType = OperationType.ROLLBACK
     new_state: Optional[Dict[str, Any]] = None
     graph: Optional[Any] = None  # CompiledStateGraph for *_AND_RUN operations
+    
+    def __post_init__(self):
+        # Fork fans repeat the same IDs; share one str object per ID.
+        # Results copy these references, so they are shared there too.
+        if type(self.execution_id) is str:
+            object.__setattr__(self, "execution_id", sys.intern(self.execution_id))
+        if type(self.checkpoint_id) is str:
+            object.__setattr__(self, "checkpoint_id", sys.intern(self.checkpoint_id))
+    
+    @classmethod
+    def bulk_from_tuples(
+        cls,
+        items: List[tuple],  # [(exec_id, checkpoint_id, new_state?), ...]
+        operation: OperationType,
+    ) -> List[BatchOperationRequest]:
+        """
+        Build one request per (execution_id, checkpoint_id[, new_state]) tuple.
+        
+        Uses positional construction, which skips keyword matching in the
+        generated __init__ for large batches.
+        """
+        return [
+            cls(item[0], item[1], operation, item[2] if len(item) > 2 else None)
+            for item in items
+        ]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BatchOperationResult:
     """
     Result of a batch operation.
@@ -123,7 +156,7 @@ class BatchOperationResult:
     checkpoint_id: str
     operation: OperationType
     success: bool
-    result_execution: Optional["Execution"] = None
+    result_execution: Optional[Execution] = None
     new_execution_id: Optional[str] = None  # For fork: new execution ID
     files_restored: int = 0
     error: Optional[str] = None
@@ -133,12 +166,49 @@ class BatchOperationResult:
         return {
             "execution_id": self.execution_id,
             "checkpoint_id": self.checkpoint_id,
-            "operation": self.operation.value,
+            "operation": _OP_VALUES[self.operation],
             "success": self.success,
             "new_execution_id": self.new_execution_id,
             "files_restored": self.files_restored,
             "error": self.error,
         }
+    
+    @staticmethod
+    def summarize(results: List[BatchOperationResult]) -> Dict[str, Any]:
+        """
+        Aggregate a batch for reporting in a single pass.
+        
+        Returns:
+            Dict with total/succeeded/failed counts, summed files_restored,
+            and per-operation counts keyed by OperationType value.
+        """
+        succeeded = 0
+        files_restored = 0
+        by_operation: Dict[str, int] = dict.fromkeys(_OP_VALUES.values(), 0)
+        for result in results:
+            succeeded += result.success
+            files_restored += result.files_restored
+            by_operation[_OP_VALUES[result.operation]] += 1
+        return {
+            "total": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "files_restored": files_restored,
+            "by_operation": by_operation,
+        }
+
+
+class BatchOperationError(RuntimeError):
+    """
+    Raised when an atomic batch is rolled back.
+    
+    Carries per-request results so callers can see which request
+    failed and which were rolled back or never processed.
+    """
+    
+    def __init__(self, message: str, results: List[BatchOperationResult]):
+        super().__init__(message)
+        self.results = results
 
 
 class IExecutionControllerFactory(ABC):
@@ -157,10 +227,10 @@ class IExecutionControllerFactory(ABC):
     @abstractmethod
     def create(
         self,
-        uow: "IUnitOfWork",
-        state_adapter: "IStateAdapter",
-        file_tracking_service: Optional["IFileTrackingService"] = None,
-    ) -> "IExecutionController":
+        uow: IUnitOfWork,
+        state_adapter: IStateAdapter,
+        file_tracking_service: Optional[IFileTrackingService] = None,
+    ) -> IExecutionController:
         """
         Create ExecutionController with injected dependencies.
         
@@ -173,6 +243,32 @@ class IExecutionControllerFactory(ABC):
             Configured IExecutionController instance
         """
         pass
+    
+    def create_many(
+        self,
+        uows: List[IUnitOfWork],
+        state_adapter: IStateAdapter,
+        file_tracking_service: Optional[IFileTrackingService] = None,
+    ) -> List[IExecutionController]:
+        """
+        Create one controller per UoW, sharing the other dependencies.
+        
+        Default implementation calls create() per UoW. Override to
+        amortize per-controller setup (validation, DI resolution)
+        across a batch.
+        
+        Args:
+            uows: Units of work, one per controller
+            state_adapter: State adapter shared by all controllers
+            file_tracking_service: Optional file tracking service
+            
+        Returns:
+            Controllers in the same order as uows
+        """
+        return [
+            self.create(uow, state_adapter, file_tracking_service)
+            for uow in uows
+        ]
 
 
 class IBatchExecutionCoordinator(ABC):
@@ -217,7 +313,7 @@ class IBatchExecutionCoordinator(ABC):
         self,
         execution_id: str,
         checkpoint_id: str,
-    ) -> "Execution":
+    ) -> Execution:
         """
         Rollback execution to checkpoint (destructive).
         
@@ -249,7 +345,7 @@ class IBatchExecutionCoordinator(ABC):
         execution_id: str,
         checkpoint_id: str,
         new_state: Optional[Dict[str, Any]] = None,
-    ) -> "Execution":
+    ) -> Execution:
         """
         Fork execution from checkpoint (non-destructive).
         
@@ -281,7 +377,7 @@ class IBatchExecutionCoordinator(ABC):
         execution_id: str,
         checkpoint_id: str,
         graph: Any,
-    ) -> "Execution":
+    ) -> Execution:
         """
         Rollback and continue execution (atomic).
         
@@ -309,7 +405,7 @@ class IBatchExecutionCoordinator(ABC):
         checkpoint_id: str,
         graph: Any,
         new_state: Optional[Dict[str, Any]] = None,
-    ) -> "Execution":
+    ) -> Execution:
         """
         Fork and run new execution (atomic).
         
@@ -376,15 +472,9 @@ class IBatchExecutionCoordinator(ABC):
         Returns:
             List of BatchOperationResult
         """
-        requests = [
-            BatchOperationRequest(
-                execution_id=exec_id,
-                checkpoint_id=cp_id,
-                operation=OperationType.ROLLBACK,
-            )
-            for exec_id, cp_id in items
-        ]
-        return self.batch_operate(requests)
+        return self.batch_operate(
+            BatchOperationRequest.bulk_from_tuples(items, OperationType.ROLLBACK)
+        )
     
     def batch_fork(
         self,
@@ -400,14 +490,141 @@ class IBatchExecutionCoordinator(ABC):
         Returns:
             List of BatchOperationResult
         """
-        requests = []
-        for item in items:
-            exec_id, cp_id = item[0], item[1]
-            new_state = item[2] if len(item) > 2 else None
-            requests.append(BatchOperationRequest(
-                execution_id=exec_id,
-                checkpoint_id=cp_id,
-                operation=OperationType.FORK,
-                new_state=new_state,
+        return self.batch_operate(
+            BatchOperationRequest.bulk_from_tuples(items, OperationType.FORK)
+        )
+
+
+class IAsyncBatchExecutionCoordinator(ABC):
+    """
+    Async interface for batch execution coordination.
+    
+    Mirrors IBatchExecutionCoordinator for event-loop callers (REST/gRPC
+    routes). Follows the repo's async naming: a-prefixed coroutines.
+    
+    abatch_operate() has a default implementation that overlaps all
+    requests via asyncio.gather, bounded by a semaphore so the DB
+    connection pool is not exhausted.
+    """
+    
+    @abstractmethod
+    async def arollback(
+        self,
+        execution_id: str,
+        checkpoint_id: str,
+    ) -> Execution:
+        """Async rollback (see IBatchExecutionCoordinator.rollback)."""
+        pass
+    
+    @abstractmethod
+    async def afork(
+        self,
+        execution_id: str,
+        checkpoint_id: str,
+        new_state: Optional[Dict[str, Any]] = None,
+    ) -> Execution:
+        """Async fork (see IBatchExecutionCoordinator.fork)."""
+        pass
+    
+    @abstractmethod
+    async def arollback_and_run(
+        self,
+        execution_id: str,
+        checkpoint_id: str,
+        graph: Any,
+    ) -> Execution:
+        """Async rollback and run (see IBatchExecutionCoordinator.rollback_and_run)."""
+        pass
+    
+    @abstractmethod
+    async def afork_and_run(
+        self,
+        execution_id: str,
+        checkpoint_id: str,
+        graph: Any,
+        new_state: Optional[Dict[str, Any]] = None,
+    ) -> Execution:
+        """Async fork and run (see IBatchExecutionCoordinator.fork_and_run)."""
+        pass
+    
+    async def abatch_operate(
+        self,
+        requests: List[BatchOperationRequest],
+        max_concurrency: int = 4,
+        stop_on_error: bool = False,
+    ) -> List[BatchOperationResult]:
+        """
+        Execute batch operations concurrently.
+        
+        Each request runs in its own transaction; at most max_concurrency
+        run at once. Failures are reported per request, never raised.
+        
+        Args:
+            requests: List of operation requests
+            max_concurrency: Maximum requests in flight
+            stop_on_error: If True, requests not yet started when a failure
+                           is seen are skipped and left out of the results;
+                           requests already in flight still complete.
+            
+        Returns:
+            List of BatchOperationResult (same order as requests)
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        stop = asyncio.Event()
+        skipped = object()
+        
+        async def dispatch(req: BatchOperationRequest) -> Any:
+            async with semaphore:
+                if stop.is_set():
+                    return skipped
+                try:
+                    return await self._adispatch(req)
+                except Exception:
+                    if stop_on_error:
+                        stop.set()
+                    raise
+        
+        outcomes = await asyncio.gather(
+            *(dispatch(req) for req in requests),
+            return_exceptions=True,
+        )
+        
+        results: List[BatchOperationResult] = []
+        for req, outcome in zip(requests, outcomes):
+            if outcome is skipped:
+                continue
+            if isinstance(outcome, BaseException):
+                results.append(BatchOperationResult(
+                    execution_id=req.execution_id,
+                    checkpoint_id=req.checkpoint_id,
+                    operation=req.operation,
+                    success=False,
+                    error=str(outcome),
+                ))
+                continue
+            is_fork = req.operation in (OperationType.FORK, OperationType.FORK_AND_RUN)
+            results.append(BatchOperationResult(
+                execution_id=req.execution_id,
+                checkpoint_id=req.checkpoint_id,
+                operation=req.operation,
+                success=True,
+                result_execution=outcome,
+                new_execution_id=outcome.id if is_fork else None,
             ))
-        return self.batch_operate(requests)
+        return results
+    
+    async def _adispatch(self, req: BatchOperationRequest) -> Execution:
+        """Await the a* method matching req.operation."""
+        if req.operation == OperationType.ROLLBACK:
+            return await self.arollback(req.execution_id, req.checkpoint_id)
+        if req.operation == OperationType.FORK:
+            return await self.afork(req.execution_id, req.checkpoint_id, req.new_state)
+        if req.operation == OperationType.ROLLBACK_AND_RUN:
+            return await self.arollback_and_run(
+                req.execution_id, req.checkpoint_id, req.graph
+            )
+        if req.operation == OperationType.FORK_AND_RUN:
+            return await self.afork_and_run(
+                req.execution_id, req.checkpoint_id, req.graph, req.new_state
+            )
+        raise ValueError(f"Unsupported operation: {req.operation}")
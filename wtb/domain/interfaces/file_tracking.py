@@ -25,7 +25,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
 
@@ -54,7 +54,7 @@ class CheckpointLinkError(FileTrackingError):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrackedFile:
     """
     Information about a tracked file.
@@ -87,7 +87,7 @@ class TrackedFile:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileTrackingResult:
     """
     Result of a file tracking operation.
@@ -131,7 +131,7 @@ class FileTrackingResult:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileRestoreResult:
     """
     Result of a file restore operation.
@@ -157,7 +157,7 @@ class FileRestoreResult:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileTrackingLink:
     """
     Link between a WTB checkpoint and a FileTracker commit.
@@ -190,7 +190,7 @@ class FileTrackingLink:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileCleanupResult:
     """
     Result of orphaned file cleanup operation (v1.9).
@@ -373,6 +373,32 @@ class IFileTrackingService(ABC):
         """
         pass
     
+    def link_to_checkpoints(
+        self,
+        links: List[Tuple[int, str]],
+    ) -> List[FileTrackingLink]:
+        """
+        Link several existing commits to checkpoints.
+        
+        Default implementation calls link_to_checkpoint() per link.
+        Implementations may override to write all links in one
+        transaction.
+        
+        Args:
+            links: (checkpoint_id, commit_id) pairs
+            
+        Returns:
+            FileTrackingLink per pair (same order)
+            
+        Raises:
+            CommitNotFoundError: If a commit does not exist
+            CheckpointLinkError: If linking fails
+        """
+        return [
+            self.link_to_checkpoint(checkpoint_id, commit_id)
+            for checkpoint_id, commit_id in links
+        ]
+    
     @abstractmethod
     def restore_from_checkpoint(
         self,
@@ -417,6 +443,39 @@ class IFileTrackingService(ABC):
         """
         pass
     
+    def restore_commits(
+        self,
+        commit_ids: List[str],
+    ) -> List[FileRestoreResult]:
+        """
+        Restore files from several commits (best-effort).
+        
+        Default implementation calls restore_commit() per commit.
+        Implementations may override to open the file repository once
+        for the whole batch.
+        
+        Args:
+            commit_ids: FileTracker commit IDs, restored in order
+            
+        Returns:
+            FileRestoreResult per commit (same order). Missing commits
+            yield a failed result instead of raising.
+        """
+        results = []
+        for commit_id in commit_ids:
+            try:
+                results.append(self.restore_commit(commit_id))
+            except FileTrackingError as e:
+                results.append(FileRestoreResult(
+                    commit_id=commit_id,
+                    files_restored=0,
+                    total_size_bytes=0,
+                    restored_paths=[],
+                    success=False,
+                    error_message=str(e),
+                ))
+        return results
+    
     @abstractmethod
     def get_commit_for_checkpoint(
         self,
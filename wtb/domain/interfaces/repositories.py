@@ -417,6 +417,19 @@ class IOutboxRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def add_many(self, events: List["OutboxEvent"]) -> List["OutboxEvent"]:
+        """
+        Add several outbox events in one round-trip.
+        
+        Args:
+            events: Outbox events to add, in order
+            
+        Returns:
+            Added events with IDs assigned (same order)
+        """
+        pass
+    
     @abstractmethod
     def get_by_id(self, event_id: str) -> Optional["OutboxEvent"]:
         """
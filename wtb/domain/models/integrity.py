@@ -15,7 +15,7 @@ from datetime import datetime
 from enum import Enum
 
 
-class IntegrityIssueType(Enum):
+class IntegrityIssueType(str, Enum):
     """Types of integrity issues detected."""
     DANGLING_REFERENCE = "dangling_reference"     # Reference to non-existent record
     ORPHAN_CHECKPOINT = "orphan_checkpoint"       # Checkpoint not referenced by WTB
@@ -25,14 +25,14 @@ class IntegrityIssueType(Enum):
     MISSING_BLOB = "missing_blob"                 # Blob file missing from storage
 
 
-class IntegritySeverity(Enum):
+class IntegritySeverity(str, Enum):
     """Severity level of integrity issues."""
     CRITICAL = "critical"   # Must fix, affects functionality
     WARNING = "warning"     # Should fix, may cause problems
     INFO = "info"           # For reference only
 
 
-class RepairAction(Enum):
+class RepairAction(str, Enum):
     """Available repair actions for issues."""
     DELETE_ORPHAN = "delete_orphan"
     CREATE_MISSING = "create_missing"
@@ -41,7 +41,30 @@ class RepairAction(Enum):
     MANUAL_REQUIRED = "manual_required"
 
 
-@dataclass
+# IntegrityIssue.to_dict() keys, in order; the columns of
+# IntegrityReport.to_columnar_dict()
+_ISSUE_FIELDS = (
+    "issue_type",
+    "severity",
+    "source_table",
+    "source_id",
+    "target_table",
+    "target_id",
+    "message",
+    "details",
+    "suggested_action",
+    "auto_repairable",
+)
+
+# detailed_summary() marker per severity
+_SEVERITY_ICONS = {
+    IntegritySeverity.CRITICAL: "🔴",
+    IntegritySeverity.WARNING: "🟡",
+    IntegritySeverity.INFO: "🔵",
+}
+
+
+@dataclass(slots=True)
 class IntegrityIssue:
     """
     Single integrity issue detected during checking.
@@ -174,7 +197,7 @@ class IntegrityIssue:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class IntegrityReport:
     """
     Aggregated integrity check report.
@@ -232,6 +255,36 @@ class IntegrityReport:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
+        return self._to_dict([i.to_dict() for i in self.issues])
+    
+    def to_columnar_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary with issues laid out column-wise.
+        
+        Same as to_dict(), except "issues" maps each issue field to a list
+        with one value per issue. Large reports serialize without building
+        one dict per issue.
+        """
+        rows = [
+            (
+                i.issue_type.value,
+                i.severity.value,
+                i.source_table,
+                i.source_id,
+                i.target_table,
+                i.target_id,
+                i.message,
+                i.details,
+                i.suggested_action.value,
+                i.auto_repairable,
+            )
+            for i in self.issues
+        ]
+        columns = zip(*rows) if rows else ([] for _ in _ISSUE_FIELDS)
+        return self._to_dict(dict(zip(_ISSUE_FIELDS, map(list, columns))))
+    
+    def _to_dict(self, issues: Any) -> Dict[str, Any]:
+        """Build the serialized report around pre-serialized issues."""
         return {
             "checked_at": self.checked_at.isoformat(),
             "duration_ms": self.duration_ms,
@@ -241,7 +294,7 @@ class IntegrityReport:
             "warning_count": self.warning_count,
             "info_count": self.info_count,
             "is_healthy": self.is_healthy,
-            "issues": [i.to_dict() for i in self.issues],
+            "issues": issues,
             "repaired_count": self.repaired_count,
             "repair_failed_count": self.repair_failed_count,
         }
@@ -265,11 +318,7 @@ class IntegrityReport:
         lines = [self.summary(), "", "Details:"]
         
         for issue in self.issues:
-            severity_icon = {
-                IntegritySeverity.CRITICAL: "🔴",
-                IntegritySeverity.WARNING: "🟡",
-                IntegritySeverity.INFO: "🔵",
-            }.get(issue.severity, "⚪")
+            severity_icon = _SEVERITY_ICONS.get(issue.severity, "⚪")
             
             lines.append(f"  {severity_icon} [{issue.issue_type.value}] {issue.message}")
             if issue.auto_repairable:
@@ -17,7 +17,7 @@ from enum import Enum
 import uuid
 
 
-class OutboxEventType(Enum):
+class OutboxEventType(str, Enum):
     """Outbox event types for cross-database operations."""
     
     # AgentGit related
@@ -42,6 +42,7 @@ class OutboxEventType(Enum):
     
     # Rollback/Recovery operations
     ROLLBACK_FILE_RESTORE = "rollback_file_restore"
+    ROLLBACK_FILE_RESTORE_BATCH = "rollback_file_restore_batch"  # Coalesced batch restore
     ROLLBACK_VERIFY = "rollback_verify"
     ROLLBACK_PERFORMED = "rollback_performed"  # v2.0 API
     FILE_CLEANUP_COMPLETED = "file_cleanup_completed"  # v1.9: Orphaned file cleanup
@@ -60,9 +61,11 @@ class OutboxEventType(Enum):
     
     # Batch coordination events (v1.8 - 2026-02-05)
     EXECUTION_FORKED = "execution_forked"
+    BATCH_ROLLBACK_PERFORMED = "batch_rollback_performed"  # Summary of atomic batch rollbacks
+    BATCH_FORK_PERFORMED = "batch_fork_performed"  # Summary of atomic batch forks
 
 
-class OutboxStatus(Enum):
+class OutboxStatus(str, Enum):
     """Outbox event processing status."""
     PENDING = "pending"
     PROCESSING = "processing"
@@ -70,7 +73,16 @@ class OutboxStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+# Statuses from which an event may be (re)processed
+_RETRYABLE_STATUSES = frozenset({OutboxStatus.PENDING, OutboxStatus.FAILED})
+
+# Value -> member tables for from_dict() and OutboxMapper; skip Enum.__call__
+# for known values
+_EVENT_TYPES_BY_VALUE = {t.value: t for t in OutboxEventType}
+_STATUSES_BY_VALUE = {s.value: s for s in OutboxStatus}
+
+
+@dataclass(slots=True)
 class OutboxEvent:
     """
     Outbox Event Entity.
@@ -126,7 +138,7 @@ class OutboxEvent:
     def can_retry(self) -> bool:
         """Check if the event can be retried."""
         return (
-            self.status in [OutboxStatus.PENDING, OutboxStatus.FAILED]
+            self.status in _RETRYABLE_STATUSES
             and self.retry_count < self.max_retries
         )
     
@@ -178,15 +190,17 @@ class OutboxEvent:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "OutboxEvent":
         """Create from dictionary."""
+        event_type = data.get("event_type", "checkpoint_create")
+        status = data.get("status", "pending")
         return cls(
             id=data.get("id"),
             event_id=data.get("event_id", str(uuid.uuid4())),
-            event_type=OutboxEventType(data.get("event_type", "checkpoint_create")),
+            event_type=_EVENT_TYPES_BY_VALUE.get(event_type) or OutboxEventType(event_type),
             aggregate_type=data.get("aggregate_type", ""),
             aggregate_id=data.get("aggregate_id", ""),
             payload=data.get("payload", {}),
             idempotency_key=data.get("idempotency_key"),
-            status=OutboxStatus(data.get("status", "pending")),
+            status=_STATUSES_BY_VALUE.get(status) or OutboxStatus(status),
             retry_count=data.get("retry_count", 0),
             max_retries=data.get("max_retries", 5),
             created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else datetime.now(),
@@ -367,6 +381,54 @@ class OutboxEvent:
             }
         )
     
+    @classmethod
+    def create_rollback_file_restore_batch(
+        cls,
+        batch_id: str,
+        restores: list,
+        **options: Any,
+    ) -> "OutboxEvent":
+        """
+        Factory method for coalesced rollback file restore events.
+        
+        Each entry in restores carries the same keys as a single
+        ROLLBACK_FILE_RESTORE payload; options (e.g. cleanup settings)
+        apply to every entry.
+        """
+        return cls(
+            event_type=OutboxEventType.ROLLBACK_FILE_RESTORE_BATCH,
+            aggregate_type="Batch",
+            aggregate_id=batch_id,
+            payload={
+                "restores": restores,
+                **options,
+            }
+        )
+    
+    @classmethod
+    def create_batch_audit(
+        cls,
+        event_type: OutboxEventType,
+        batch_id: str,
+        operations: list,
+    ) -> "OutboxEvent":
+        """
+        Factory method for batch audit summary events.
+        
+        One BATCH_ROLLBACK_PERFORMED / BATCH_FORK_PERFORMED event replaces
+        the per-operation audit events of an atomic batch; each entry in
+        operations is the payload the per-operation event would have had.
+        """
+        return cls(
+            event_type=event_type,
+            aggregate_type="Batch",
+            aggregate_id=batch_id,
+            payload={
+                "operations": operations,
+                "count": len(operations),
+            }
+        )
+    
     @classmethod
     def create_rollback_verify(
         cls,
@@ -399,6 +399,9 @@ class InMemoryOutboxRepository(IOutboxRepository):
         self._store[event.id] = deepcopy(event)
         return event
     
+    def add_many(self, events: List[OutboxEvent]) -> List[OutboxEvent]:
+        return [self.add(event) for event in events]
+    
     def get_by_id(self, event_id: str) -> Optional[OutboxEvent]:
         for event in self._store.values():
             if event.event_id == event_id:
@@ -14,7 +14,13 @@ import json
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from wtb.domain.models.outbox import OutboxEvent, OutboxEventType, OutboxStatus
+from wtb.domain.models.outbox import (
+    OutboxEvent,
+    OutboxEventType,
+    OutboxStatus,
+    _EVENT_TYPES_BY_VALUE,
+    _STATUSES_BY_VALUE,
+)
 
 if TYPE_CHECKING:
     from wtb.infrastructure.database.models import OutboxEventORM
@@ -61,18 +67,11 @@ class OutboxMapper:
             elif isinstance(orm.payload, dict):
                 payload = orm.payload
         
-        # Parse event_type enum
-        try:
-            event_type = OutboxEventType(orm.event_type)
-        except ValueError:
-            # Handle unknown event types gracefully
-            event_type = OutboxEventType.CHECKPOINT_CREATE
+        # Parse event_type enum (unknown event types handled gracefully)
+        event_type = _EVENT_TYPES_BY_VALUE.get(orm.event_type, OutboxEventType.CHECKPOINT_CREATE)
         
         # Parse status enum
-        try:
-            status = OutboxStatus(orm.status)
-        except ValueError:
-            status = OutboxStatus.PENDING
+        status = _STATUSES_BY_VALUE.get(orm.status, OutboxStatus.PENDING)
         
         return OutboxEvent(
             id=orm.id,
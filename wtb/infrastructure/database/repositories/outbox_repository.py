@@ -46,6 +46,15 @@ class SQLAlchemyOutboxRepository(IOutboxRepository):
         self._session.flush()
         return self._to_domain(orm)
     
+    def add_many(self, events: List[OutboxEvent]) -> List[OutboxEvent]:
+        """Add several outbox events with a single flush (batched INSERT)."""
+        if not events:
+            return []
+        orms = [self._to_orm(event) for event in events]
+        self._session.add_all(orms)
+        self._session.flush()
+        return [self._to_domain(orm) for orm in orms]
+    
     def get_by_id(self, event_id: str) -> Optional[OutboxEvent]:
         """Get event by event_id (UUID)."""
         orm = (
@@ -41,10 +41,12 @@ Usage:
 import fnmatch
 import logging
 import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import List, Optional, Pattern, Set, Union
 
 from wtb.domain.interfaces.file_tracking import (
     FileCleanupResult,
@@ -54,6 +56,11 @@ from wtb.domain.interfaces.file_tracking import (
 
 logger = logging.getLogger(__name__)
 
+# Below this many top-level directories, a single walker is as fast
+PARALLEL_SCAN_MIN_DIRS = 2
+# Directory scans are metadata I/O bound; os.scandir() releases the GIL
+MAX_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 class FileCleanupService(IFileCleanupService):
     """
@@ -124,15 +131,15 @@ class FileCleanupService(IFileCleanupService):
         logger.debug(f"Found {len(current_files)} current files matching patterns")
         
         # 3. Orphaned = current - checkpoint
-        # Normalize paths for comparison
-        checkpoint_files_normalized = set(
-            self._normalize_path(p, current_workspace_path) 
-            for p in checkpoint_files
-        )
-        current_files_normalized = set(
-            self._normalize_path(p, current_workspace_path) 
-            for p in current_files
-        )
+        # Normalize paths for comparison (set lookups stay O(1) per path;
+        # the cost here is resolving each path, so keep it string-level)
+        workspace = os.fspath(current_workspace_path)
+        checkpoint_files_normalized = {
+            self._normalize_path(p, workspace) for p in checkpoint_files
+        }
+        current_files_normalized = {
+            self._normalize_path(p, workspace) for p in current_files
+        }
         
         orphaned = list(current_files_normalized - checkpoint_files_normalized)
         
@@ -297,50 +304,133 @@ class FileCleanupService(IFileCleanupService):
             logger.debug("No track patterns specified, skipping file discovery")
             return discovered
         
-        # Walk the workspace
-        for root, dirs, files in os.walk(workspace_path):
+        # One regex per pattern list: a single match() per path instead of
+        # one fnmatch() per pattern
+        track = self._compile_patterns(track_patterns)
+        exclude = self._compile_patterns(exclude_patterns)
+        
+        # Scan the root inline, then fan the top-level subtrees out to
+        # threads; each subtree is walked by one os.walk (scandir-based)
+        workspace = os.fspath(workspace_path)
+        subdirs: List[str] = []
+        with os.scandir(workspace) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Skip hidden directories; like os.walk(), list but
+                    # don't follow symlinked ones
+                    if not entry.name.startswith('.') and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif self._matches_file(entry.name, entry.name, track, exclude):
+                    discovered.add(entry.path)
+        
+        if len(subdirs) < PARALLEL_SCAN_MIN_DIRS:
+            for top in subdirs:
+                discovered.update(self._scan_tree(top, workspace, track, exclude))
+            return discovered
+        
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_SCAN_WORKERS, len(subdirs)),
+            thread_name_prefix="wtb-scan",
+        ) as executor:
+            for found in executor.map(
+                lambda top: self._scan_tree(top, workspace, track, exclude),
+                subdirs,
+            ):
+                discovered.update(found)
+        
+        return discovered
+    
+    @classmethod
+    def _scan_tree(
+        cls,
+        top: str,
+        workspace: str,
+        track: Optional[Pattern[str]],
+        exclude: Optional[Pattern[str]],
+    ) -> List[str]:
+        """
+        Walk one subtree of the workspace and collect matching files.
+        
+        Args:
+            top: Subtree root (absolute path under workspace)
+            workspace: Workspace root, for workspace-relative matching
+            track: Compiled track patterns
+            exclude: Compiled exclude patterns
+            
+        Returns:
+            Matching file paths (as strings)
+        """
+        found: List[str] = []
+        for root, dirs, files in os.walk(top):
             # Skip hidden directories
             dirs[:] = [d for d in dirs if not d.startswith('.')]
             
+            # One relpath() per directory instead of per file
+            rel_prefix = os.path.relpath(root, workspace) + os.sep
+            
             for filename in files:
-                file_path = os.path.join(root, filename)
-                rel_path = os.path.relpath(file_path, workspace_path)
-                
-                # Check if matches any track pattern
-                if not self._matches_patterns(rel_path, track_patterns):
-                    continue
-                
-                # Check if matches any exclude pattern
-                if self._matches_patterns(rel_path, exclude_patterns):
-                    continue
-                
-                discovered.add(file_path)
+                if cls._matches_file(rel_prefix + filename, filename, track, exclude):
+                    found.append(os.path.join(root, filename))
+        return found
+    
+    @classmethod
+    def _matches_file(
+        cls,
+        rel_path: str,
+        filename: str,
+        track: Optional[Pattern[str]],
+        exclude: Optional[Pattern[str]],
+    ) -> bool:
+        """Check a file against track patterns, then exclude patterns."""
+        return (
+            cls._matches(rel_path, filename, track)
+            and not cls._matches(rel_path, filename, exclude)
+        )
+    
+    @staticmethod
+    def _compile_patterns(patterns: List[str]) -> Optional[Pattern[str]]:
+        """
+        Compile glob patterns into a single alternation regex.
         
-        return discovered
+        Args:
+            patterns: List of glob patterns
+            
+        Returns:
+            Compiled regex matching any pattern, or None if patterns is empty
+        """
+        if not patterns:
+            return None
+        return re.compile("|".join(
+            fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns
+        ))
     
-    def _matches_patterns(self, path: str, patterns: List[str]) -> bool:
+    @staticmethod
+    def _matches(path: str, filename: str, matcher: Optional[Pattern[str]]) -> bool:
         """
-        Check if path matches any of the glob patterns.
+        Check if path (or just its filename) matches a compiled pattern set.
         
         Args:
             path: File path to check
-            patterns: List of glob patterns
+            filename: Basename of path
+            matcher: Regex from _compile_patterns(), or None for no patterns
             
         Returns:
-            True if path matches any pattern
+            True if path or filename matches any pattern
         """
-        for pattern in patterns:
-            if fnmatch.fnmatch(path, pattern):
-                return True
-            # Also check just the filename
-            if fnmatch.fnmatch(os.path.basename(path), pattern):
-                return True
-        return False
+        if matcher is None:
+            return False
+        return bool(
+            matcher.match(os.path.normcase(path))
+            or matcher.match(os.path.normcase(filename))
+        )
     
-    def _normalize_path(self, path: str, workspace_path: Path) -> str:
+    def _normalize_path(self, path: str, workspace_path: Union[str, Path]) -> str:
         """
         Normalize path to absolute form for comparison.
         
+        Equivalent to (workspace_path / path).resolve() without building
+        Path objects: os.path.join() keeps absolute paths as-is.
+        
         Args:
             path: Path to normalize (may be relative or absolute)
             workspace_path: Workspace root for relative paths
@@ -348,10 +438,7 @@ class FileCleanupService(IFileCleanupService):
         Returns:
             Absolute normalized path
         """
-        p = Path(path)
-        if not p.is_absolute():
-            p = workspace_path / p
-        return str(p.resolve())
+        return os.path.realpath(os.path.join(workspace_path, path))
     
     def _backup_file(self, file_path: str, backup_dir: Path) -> Optional[str]:
         """
@@ -532,6 +532,24 @@ class FileTrackerService(IFileTrackingService):
                     error_message=str(e),
                 )
     
+    def restore_commits(
+        self,
+        commit_ids: List[str],
+    ) -> List[FileRestoreResult]:
+        """
+        Restore files from several commits with one repository open.
+        
+        Initializes the FileTracker repositories once and holds the lock
+        for the whole batch.
+        """
+        if not self._config.enabled:
+            return super().restore_commits(commit_ids)
+        
+        self._ensure_initialized()
+        
+        with self._lock:
+            return super().restore_commits(commit_ids)
+    
     def restore_to_workspace(
         self,
         commit_id: str,
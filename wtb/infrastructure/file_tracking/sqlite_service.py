@@ -35,14 +35,17 @@ Storage Layout:
 
 import hashlib
 import logging
+import mmap
 import os
 import shutil
 import sqlite3
 import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from wtb.domain.interfaces.file_tracking import (
     IFileTrackingService,
@@ -58,6 +61,19 @@ from wtb.domain.interfaces.file_tracking import (
 
 logger = logging.getLogger(__name__)
 
+# Below this many files, thread start-up costs more than parallel hashing saves
+PARALLEL_HASH_MIN_FILES = 4
+MAX_HASH_WORKERS = min(8, os.cpu_count() or 1)
+# Files at least this large are hashed via mmap instead of read() copies
+MMAP_HASH_MIN_BYTES = 1024 * 1024
+# Max bound parameters per "IN (...)" query (SQLite's historic limit is 999)
+SQL_IN_CHUNK_SIZE = 500
+# Upper bound on remembered file digests before the memo is reset
+DIGEST_CACHE_MAX_ENTRIES = 100_000
+# Coarsest mtime granularity we allow for (FAT stores 2 s); files modified
+# this close to their hashing are never memoized (git's racy-clean rule)
+DIGEST_RACY_WINDOW_NS = 2_000_000_000
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # SQL Schema
@@ -150,6 +166,10 @@ class SqliteFileTrackingService(IFileTrackingService):
         self._lock = threading.RLock()
         self._local = threading.local()
         
+        # (st_dev, st_ino) -> (st_mtime_ns, st_size, sha256): lets unchanged
+        # files skip re-hashing on incremental commits
+        self._digest_cache: Dict[tuple[int, int], tuple[int, int, str]] = {}
+        
         # Initialize storage
         self._init_storage()
     
@@ -203,11 +223,84 @@ class SqliteFileTrackingService(IFileTrackingService):
         Returns:
             64-character hex hash string
         """
-        sha256 = hashlib.sha256()
+        return self._digest_file(file_path)[0]
+    
+    def _digest_file(self, file_path: str) -> tuple[str, int]:
+        """
+        Compute SHA256 hash and size of a file with a single open().
+        
+        Uses hashlib.file_digest(), which reads into a reused buffer
+        (no per-chunk bytes objects) and hashes without holding the GIL.
+        The size comes from fstat() on the open descriptor, saving a
+        separate path lookup.
+        
+        Files whose inode, mtime and size match a previous digest reuse
+        that hash without being read (same heuristic as git's index).
+        As with git's racy-clean check, a file whose mtime lies within
+        DIGEST_RACY_WINDOW_NS of the hash is not memoized: a write in the
+        same timestamp granule would leave mtime and size unchanged.
+        
+        Args:
+            file_path: Path to file
+            
+        Returns:
+            Tuple of (64-character hex hash, file size in bytes)
+        """
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+            st = os.fstat(f.fileno())
+            key = (st.st_dev, st.st_ino)
+            cached = self._digest_cache.get(key)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return cached[2], st.st_size
+            
+            hashed_at_ns = time.time_ns()
+            if st.st_size >= MMAP_HASH_MIN_BYTES:
+                file_hash = self._digest_mapped(f.fileno())
+            else:
+                file_hash = hashlib.file_digest(f, "sha256").hexdigest()
+        
+        if hashed_at_ns - st.st_mtime_ns < DIGEST_RACY_WINDOW_NS:
+            return file_hash, st.st_size
+        
+        if len(self._digest_cache) >= DIGEST_CACHE_MAX_ENTRIES:
+            self._digest_cache.clear()
+        self._digest_cache[key] = (st.st_mtime_ns, st.st_size, file_hash)
+        return file_hash, st.st_size
+    
+    @staticmethod
+    def _digest_mapped(fd: int) -> str:
+        """
+        SHA256 of a large file hashed straight from the page cache.
+        
+        mmap avoids copying every page into a userspace read buffer;
+        MADV_SEQUENTIAL lets the kernel read ahead aggressively.
+        """
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            return hashlib.sha256(mapped).hexdigest()
+    
+    def _digest_files(self, file_paths: List[str]) -> List[tuple[str, int]]:
+        """
+        Digest several files, in parallel for larger batches.
+        
+        hashlib releases the GIL while digesting, so a thread pool hashes
+        files on multiple cores.
+        
+        Args:
+            file_paths: Paths to digest
+            
+        Returns:
+            (hash, size) tuples in the same order as file_paths
+        """
+        if len(file_paths) < PARALLEL_HASH_MIN_FILES:
+            return [self._digest_file(path) for path in file_paths]
+        
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_HASH_WORKERS, len(file_paths)),
+            thread_name_prefix="wtb-hash",
+        ) as executor:
+            return list(executor.map(self._digest_file, file_paths))
     
     def _get_blob_path(self, blob_hash: str) -> Path:
         """
@@ -221,7 +314,11 @@ class SqliteFileTrackingService(IFileTrackingService):
         """
         return self._blob_dir / blob_hash[:2] / blob_hash[2:]
     
-    def _store_blob(self, file_path: str) -> tuple[str, int]:
+    def _store_blob(
+        self,
+        file_path: str,
+        digest: Optional[tuple[str, int]] = None,
+    ) -> tuple[str, int]:
         """
         Store file content in blob storage.
         
@@ -229,14 +326,14 @@ class SqliteFileTrackingService(IFileTrackingService):
         
         Args:
             file_path: Path to source file
+            digest: Precomputed (blob_hash, file_size), if already known
             
         Returns:
             Tuple of (blob_hash, file_size)
         """
         file_path = Path(file_path)
-        blob_hash = self._hash_file(str(file_path))
+        blob_hash, file_size = digest or self._digest_file(str(file_path))
         blob_path = self._get_blob_path(blob_hash)
-        file_size = file_path.stat().st_size
         
         # Only store if not already present (deduplication)
         if not blob_path.exists():
@@ -309,8 +406,9 @@ class SqliteFileTrackingService(IFileTrackingService):
                 mementos_data = []
                 
                 # Store blobs and collect hashes FIRST
-                for path in file_paths:
-                    blob_hash, file_size = self._store_blob(path)
+                digests = self._digest_files(file_paths)
+                for path, digest in zip(file_paths, digests):
+                    blob_hash, file_size = self._store_blob(path, digest)
                     file_hashes[path] = blob_hash
                     total_size += file_size
                     mementos_data.append((commit_id, path, blob_hash, file_size, created_at))
@@ -479,6 +577,90 @@ class SqliteFileTrackingService(IFileTrackingService):
                 conn.rollback()
                 raise CheckpointLinkError(f"Failed to link: {e}") from e
     
+    def link_to_checkpoints(
+        self,
+        links: List[Tuple[int, str]],
+    ) -> List[FileTrackingLink]:
+        """
+        Link several existing commits to checkpoints in one transaction.
+        
+        Commits are looked up with one query per chunk and links are
+        written with executemany(); nothing is written if any commit
+        is missing.
+        
+        Args:
+            links: (checkpoint_id, commit_id) pairs
+            
+        Returns:
+            FileTrackingLink per pair (same order)
+            
+        Raises:
+            CommitNotFoundError: If a commit does not exist
+            CheckpointLinkError: If linking fails
+        """
+        if not links:
+            return []
+        
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            # Verify commits exist
+            commit_ids = list(dict.fromkeys(commit_id for _, commit_id in links))
+            commits: Dict[str, sqlite3.Row] = {}
+            for start in range(0, len(commit_ids), SQL_IN_CHUNK_SIZE):
+                chunk = commit_ids[start:start + SQL_IN_CHUNK_SIZE]
+                cursor.execute(
+                    "SELECT commit_id, file_count, total_size_bytes FROM commits "
+                    f"WHERE commit_id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                commits.update((row['commit_id'], row) for row in cursor.fetchall())
+            
+            for _, commit_id in links:
+                if commit_id not in commits:
+                    raise CommitNotFoundError(f"Commit not found: {commit_id}")
+            
+            linked_at = datetime.now()
+            result = [
+                FileTrackingLink(
+                    checkpoint_id=checkpoint_id,
+                    commit_id=commit_id,
+                    linked_at=linked_at,
+                    file_count=commits[commit_id]['file_count'],
+                    total_size_bytes=commits[commit_id]['total_size_bytes'],
+                )
+                for checkpoint_id, commit_id in links
+            ]
+            
+            try:
+                # Replace existing links (checkpoint_id is the primary key,
+                # so a repeated checkpoint keeps its last commit)
+                cursor.executemany(
+                    """
+                    INSERT OR REPLACE INTO checkpoint_links 
+                    (checkpoint_id, commit_id, linked_at, file_count, total_size_bytes)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            link.checkpoint_id,
+                            link.commit_id,
+                            linked_at.isoformat(),
+                            link.file_count,
+                            link.total_size_bytes,
+                        )
+                        for link in result
+                    ],
+                )
+                
+                conn.commit()
+                return result
+                
+            except Exception as e:
+                conn.rollback()
+                raise CheckpointLinkError(f"Failed to link: {e}") from e
+    
     def restore_from_checkpoint(
         self,
         checkpoint_id: int,
@@ -573,6 +755,18 @@ class SqliteFileTrackingService(IFileTrackingService):
                 error_message=error_message,
             )
     
+    def restore_commits(
+        self,
+        commit_ids: List[str],
+    ) -> List[FileRestoreResult]:
+        """
+        Restore files from several commits under one lock acquisition.
+        
+        Reuses the thread-local connection for every commit.
+        """
+        with self._lock:
+            return super().restore_commits(commit_ids)
+    
     def get_commit_for_checkpoint(
         self,
         checkpoint_id: int,
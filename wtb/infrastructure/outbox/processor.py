@@ -17,6 +17,7 @@ FileTracker Integration (2026-01-15):
 - FILE_INTEGRITY_CHECK: Deep integrity verification with hash checking
 - FILE_RESTORE_VERIFY: Verify files were correctly restored
 - ROLLBACK_FILE_RESTORE: Coordinate file restoration during rollback
+- ROLLBACK_FILE_RESTORE_BATCH: Coalesced file restoration for a batch of rollbacks
 - ROLLBACK_VERIFY: Full rollback verification (state + files)
 
 Usage:
@@ -106,6 +107,10 @@ class IFileTrackingService(Protocol):
         """Restore files from a commit."""
         ...
     
+    def restore_commits(self, commit_ids: List[str]) -> List[Any]:
+        """Restore files from several commits in one call."""
+        ...
+    
     def restore_from_checkpoint(self, checkpoint_id: int) -> Any:
         """Restore files from checkpoint's linked commit."""
         ...
@@ -296,6 +301,7 @@ class OutboxProcessor:
             OutboxEventType.CHECKPOINT_FILE_LINK_VERIFY: self._handle_checkpoint_file_link_verify,
             # Rollback handlers (2026-01-15)
             OutboxEventType.ROLLBACK_FILE_RESTORE: self._handle_rollback_file_restore,
+            OutboxEventType.ROLLBACK_FILE_RESTORE_BATCH: self._handle_rollback_file_restore_batch,
             OutboxEventType.ROLLBACK_VERIFY: self._handle_rollback_verify,
         }
     
@@ -1057,6 +1063,91 @@ class OutboxProcessor:
                 execution_id=execution_id,
             )
     
+    def _handle_rollback_file_restore_batch(self, event: OutboxEvent) -> None:
+        """
+        Handle coalesced file restoration for a batch of rollbacks.
+        
+        Restores consecutive commits with a single restore_commits() call so
+        the file repository is opened once per run instead of once per
+        rollback. A run ends at each entry with orphan cleanup enabled, whose
+        cleanup runs before the next restore, so the workspace ends up as if
+        the rollbacks had been handled one event at a time. Falls back to the
+        single-event handler per entry when no IFileTrackingService is
+        available.
+        
+        Args:
+            event: OutboxEvent with payload containing:
+                - restores: List of ROLLBACK_FILE_RESTORE payloads
+                - cleanup_*/workspace_path/track_patterns/exclude_patterns:
+                  (v1.9) Shared cleanup options applied to every entry
+        """
+        payload = event.payload
+        options = {k: v for k, v in payload.items() if k != "restores"}
+        restores = [
+            {**options, **item}
+            for item in payload.get("restores", [])
+            if item.get("source_commit_id")
+        ]
+        
+        if not restores:
+            logger.warning(f"No restores in batch rollback event {event.event_id}")
+            return
+        
+        if not (self._file_tracking_service and self._file_tracking_service.is_available()):
+            for item in restores:
+                self._handle_rollback_file_restore(OutboxEvent(
+                    event_id=event.event_id,
+                    event_type=OutboxEventType.ROLLBACK_FILE_RESTORE,
+                    aggregate_type="Execution",
+                    aggregate_id=item.get("execution_id", ""),
+                    payload=item,
+                ))
+            return
+        
+        # Cleanup of one entry may touch files a later restore writes, so
+        # only entries without cleanup are restored back to back
+        runs: List[List[Dict[str, Any]]] = [[]]
+        for item in restores:
+            runs[-1].append(item)
+            if item.get("cleanup_orphaned_files", False):
+                runs.append([])
+        
+        failures = []
+        for run in filter(None, runs):
+            results = self._file_tracking_service.restore_commits(
+                [item["source_commit_id"] for item in run]
+            )
+            
+            for item, result in zip(run, results):
+                if not result or not getattr(result, 'success', True):
+                    failures.append(
+                        f"{item['source_commit_id']}: "
+                        f"{getattr(result, 'error_message', 'Unknown error')}"
+                    )
+                    continue
+                
+                files_restored = getattr(result, 'files_restored', 0)
+                self._stats["restores_verified"] += 1
+                self._stats["files_verified"] += files_restored
+                
+                if item.get("cleanup_orphaned_files", False):
+                    self._cleanup_orphaned_files_post_restore(
+                        payload=item,
+                        target_checkpoint_id=item.get("target_checkpoint_id"),
+                        execution_id=item.get("execution_id", "unknown"),
+                    )
+        
+        logger.info(
+            f"Batch rollback file restore complete: "
+            f"{len(restores) - len(failures)}/{len(restores)} commits"
+        )
+        
+        if failures:
+            message = f"Batch file restore failed for {len(failures)} commit(s): {failures}"
+            logger.error(message)
+            if self._strict:
+                raise ValueError(message)
+    
     def _cleanup_orphaned_files_post_restore(
         self,
         payload: Dict[str, Any],